@@ -10,6 +10,7 @@ Exports:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 
 from loguru import logger
@@ -55,6 +56,10 @@ class FeedbackController:
     _circuit_breaker_active: bool = False
     _circuit_breaker_triggered_at: datetime | None = None
 
+    def __init__(self, clock: Callable[[], datetime] | None = None) -> None:
+        # Source of the current UTC time; tests inject a fixed instant
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+
     # ------------------------------------------------------------------
     # Degradation detection
     # ------------------------------------------------------------------
@@ -178,7 +183,7 @@ class FeedbackController:
             return False  # Not degraded or no performance data
 
         # Check degradation duration >= 7 days
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         calculated_at = perf_30d.calculated_at
         if calculated_at is not None:
             if calculated_at.tzinfo is None:
@@ -269,7 +274,7 @@ class FeedbackController:
         Returns True if circuit breaker is active (signals should be halted).
         """
         cls = type(self)  # Use class-level state, not instance
-        now = datetime.now(timezone.utc)
+        now = self._clock()
 
         # 1. Check 24h cooldown reset
         if cls._circuit_breaker_active and cls._circuit_breaker_triggered_at is not None:
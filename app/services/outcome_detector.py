@@ -17,6 +17,7 @@ Exports:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import datetime, timezone
 from decimal import Decimal
 
@@ -61,8 +62,14 @@ class OutcomeDetector:
     _cached_price: float | None = None
     _cached_at: datetime | None = None
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
         self.api_key = api_key
+        # Source of the current UTC time; tests inject a fixed instant
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
         self.spread_model = SessionSpreadModel()
         self.performance_tracker = PerformanceTracker()
 
@@ -100,13 +107,13 @@ class OutcomeDetector:
             return []
 
         # 3. Get current spread
-        now = datetime.now(timezone.utc)
+        now = self._clock()
         spread = self.spread_model.get_spread(now)
 
         # 4. Evaluate each signal and record outcomes
         outcomes: list[Outcome] = []
         for signal in active_signals:
-            result = self._evaluate_signal(signal, price, spread)
+            result = self._evaluate_signal(signal, price, spread, now)
             if result is not None:
                 exit_price = price
                 outcome = self._record_outcome(
@@ -129,7 +136,9 @@ class OutcomeDetector:
             }
             for sid in affected_strategy_ids:
                 try:
-                    await self.performance_tracker.recalculate_for_strategy(session, sid)
+                    await self.performance_tracker.recalculate_for_strategy(
+                        session, sid, now=now
+                    )
                 except Exception:
                     logger.exception(
                         "outcome_detector: failed to recalculate performance for strategy_id={}",
@@ -167,7 +176,7 @@ class OutcomeDetector:
 
         if price is not None:
             OutcomeDetector._cached_price = price
-            OutcomeDetector._cached_at = datetime.now(timezone.utc)
+            OutcomeDetector._cached_at = self._clock()
             return price
 
         # Fall back to cached price if fresh enough
@@ -175,7 +184,7 @@ class OutcomeDetector:
             OutcomeDetector._cached_price is not None
             and OutcomeDetector._cached_at is not None
         ):
-            age = (datetime.now(timezone.utc) - OutcomeDetector._cached_at).total_seconds()
+            age = (self._clock() - OutcomeDetector._cached_at).total_seconds()
             if age <= self.CACHE_MAX_AGE_SECONDS:
                 logger.info(
                     "outcome_detector: using cached price {} (age={:.0f}s)",
@@ -237,7 +246,11 @@ class OutcomeDetector:
     # ------------------------------------------------------------------
 
     def _evaluate_signal(
-        self, signal: Signal, price: float, spread: Decimal
+        self,
+        signal: Signal,
+        price: float,
+        spread: Decimal,
+        now: datetime | None = None,
     ) -> str | None:
         """Evaluate if current price triggers any outcome for this signal.
 
@@ -255,6 +268,9 @@ class OutcomeDetector:
             signal: Signal ORM object to evaluate.
             price: Current bid price as float.
             spread: Current spread in price units as Decimal.
+            now: Current UTC datetime for the expiry check. check_outcomes()
+                passes the one it already read for the cycle; defaults to
+                the detector's clock.
 
         Returns:
             Result string ('sl_hit', 'tp1_hit', 'tp2_hit', 'expired') or None.
@@ -267,7 +283,8 @@ class OutcomeDetector:
 
         # 1. Check expiry
         if signal.expires_at is not None:
-            now = datetime.now(timezone.utc)
+            if now is None:
+                now = self._clock()
             expires = signal.expires_at
             # Handle naive datetimes by assuming UTC
             if expires.tzinfo is None:
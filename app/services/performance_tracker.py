@@ -48,22 +48,31 @@ class PerformanceTracker:
     MAX_PROFIT_FACTOR: Decimal = Decimal("9999.9999")
 
     async def recalculate_for_strategy(
-        self, session: AsyncSession, strategy_id: int
+        self,
+        session: AsyncSession,
+        strategy_id: int,
+        now: datetime | None = None,
     ) -> list[StrategyPerformance]:
         """Recalculate 7d and 30d rolling metrics for a single strategy.
 
         Args:
             session: Async SQLAlchemy session.
             strategy_id: ID of the strategy to recalculate.
+            now: Current UTC datetime anchoring both rolling windows and
+                stamped as calculated_at. Defaults to
+                datetime.now(timezone.utc).
 
         Returns:
             List of upserted StrategyPerformance rows (one per period).
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
         results: list[StrategyPerformance] = []
 
         for period_label, days in self.PERIODS.items():
-            metrics = await self._compute_metrics(session, strategy_id, period_label, days)
-            perf = await self._upsert_performance(session, strategy_id, period_label, metrics)
+            metrics = await self._compute_metrics(session, strategy_id, period_label, days, now)
+            perf = await self._upsert_performance(session, strategy_id, period_label, metrics, now)
             results.append(perf)
 
         await session.commit()
@@ -82,6 +91,7 @@ class PerformanceTracker:
         strategy_id: int,
         period_label: str,
         days: int,
+        now: datetime,
     ) -> dict:
         """Compute win_rate, profit_factor, avg_rr for a rolling window.
 
@@ -93,11 +103,12 @@ class PerformanceTracker:
             strategy_id: Strategy to filter by.
             period_label: Label string (e.g. "7d").
             days: Number of days in the rolling window.
+            now: Current UTC datetime; the window ends here.
 
         Returns:
             Dict with keys: win_rate, profit_factor, avg_rr, total_signals.
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        cutoff = now - timedelta(days=days)
 
         # Query outcomes for this strategy within the window
         stmt = (
@@ -158,6 +169,7 @@ class PerformanceTracker:
         strategy_id: int,
         period: str,
         metrics: dict,
+        now: datetime,
     ) -> StrategyPerformance:
         """Upsert a StrategyPerformance row for the given strategy+period.
 
@@ -169,6 +181,7 @@ class PerformanceTracker:
             strategy_id: Strategy ID.
             period: Period label (e.g. "7d", "30d").
             metrics: Dict from _compute_metrics().
+            now: Current UTC datetime, stamped as calculated_at on update.
 
         Returns:
             The upserted StrategyPerformance row.
@@ -180,8 +193,6 @@ class PerformanceTracker:
         result = await session.execute(stmt)
         existing = result.scalar_one_or_none()
 
-        now = datetime.now(timezone.utc)
-
         if existing is not None:
             existing.win_rate = metrics["win_rate"]
             existing.profit_factor = metrics["profit_factor"]
@@ -21,6 +21,22 @@ from app.workers.jobs import (
     send_health_digest,
 )
 
+
+# Cron triggers are stateless schedule descriptions, so parse each spec once
+# at import rather than on every register_jobs() call. The check_outcomes
+# IntervalTrigger is built in register_jobs() instead: its start_date is
+# fixed at construction and sets the phase of every 90-second tick.
+_TRIG_M15 = CronTrigger(minute="1,16,31,46", timezone="UTC")
+_TRIG_H1 = CronTrigger(minute=1, timezone="UTC")
+_TRIG_H4 = CronTrigger(hour="0,4,8,12,16,20", minute=1, timezone="UTC")
+_TRIG_D1 = CronTrigger(hour=0, minute=1, timezone="UTC")
+_TRIG_BACKTESTS = CronTrigger(hour="1,5,9,13,17,21", minute=0, timezone="UTC")
+_TRIG_SIGNAL_SCANNER = CronTrigger(minute="2,32", timezone="UTC")
+_TRIG_PARAM_OPTIMIZATION = CronTrigger(hour="3,9,15,21", minute=30, timezone="UTC")
+_TRIG_DATA_RETENTION = CronTrigger(hour=3, minute=0, timezone="UTC")
+_TRIG_HEALTH_DIGEST = CronTrigger(hour=6, minute=0, timezone="UTC")
+
+
 scheduler = AsyncIOScheduler(
     jobstores={
         "default": MemoryJobStore(),
@@ -49,7 +65,7 @@ def register_jobs() -> None:
     """
     scheduler.add_job(
         refresh_candles,
-        trigger=CronTrigger(minute="1,16,31,46", timezone="UTC"),
+        trigger=_TRIG_M15,
         args=["M15"],
         id="refresh_candles_M15",
         name="Refresh M15 candles",
@@ -59,7 +75,7 @@ def register_jobs() -> None:
 
     scheduler.add_job(
         refresh_candles,
-        trigger=CronTrigger(minute=1, timezone="UTC"),
+        trigger=_TRIG_H1,
         args=["H1"],
         id="refresh_candles_H1",
         name="Refresh H1 candles",
@@ -69,7 +85,7 @@ def register_jobs() -> None:
 
     scheduler.add_job(
         refresh_candles,
-        trigger=CronTrigger(hour="0,4,8,12,16,20", minute=1, timezone="UTC"),
+        trigger=_TRIG_H4,
         args=["H4"],
         id="refresh_candles_H4",
         name="Refresh H4 candles",
@@ -79,7 +95,7 @@ def register_jobs() -> None:
 
     scheduler.add_job(
         refresh_candles,
-        trigger=CronTrigger(hour=0, minute=1, timezone="UTC"),
+        trigger=_TRIG_D1,
         args=["D1"],
         id="refresh_candles_D1",
         name="Refresh D1 candles",
@@ -89,7 +105,7 @@ def register_jobs() -> None:
 
     scheduler.add_job(
         run_daily_backtests,
-        trigger=CronTrigger(hour="1,5,9,13,17,21", minute=0, timezone="UTC"),
+        trigger=_TRIG_BACKTESTS,
         id="run_daily_backtests",
         name="Run backtests (4h)",
         replace_existing=True,
@@ -98,7 +114,7 @@ def register_jobs() -> None:
 
     scheduler.add_job(
         run_signal_scanner,
-        trigger=CronTrigger(minute="2,32", timezone="UTC"),
+        trigger=_TRIG_SIGNAL_SCANNER,
         id="run_signal_scanner",
         name="Run signal scanner (30min)",
         replace_existing=True,
@@ -107,7 +123,7 @@ def register_jobs() -> None:
 
     scheduler.add_job(
         run_param_optimization,
-        trigger=CronTrigger(hour="3,9,15,21", minute=30, timezone="UTC"),
+        trigger=_TRIG_PARAM_OPTIMIZATION,
         id="run_param_optimization",
         name="Run param optimization (6h)",
         replace_existing=True,
@@ -127,7 +143,7 @@ def register_jobs() -> None:
 
     scheduler.add_job(
         run_data_retention,
-        trigger=CronTrigger(hour=3, minute=0, timezone="UTC"),
+        trigger=_TRIG_DATA_RETENTION,
         id="run_data_retention",
         name="Run data retention",
         replace_existing=True,
@@ -136,7 +152,7 @@ def register_jobs() -> None:
 
     scheduler.add_job(
         send_health_digest,
-        trigger=CronTrigger(hour=6, minute=0, timezone="UTC"),
+        trigger=_TRIG_HEALTH_DIGEST,
         id="send_health_digest",
         name="Send health digest",
         replace_existing=True,
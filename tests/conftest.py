@@ -8,14 +8,12 @@ from unittest.mock import MagicMock, patch
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import (
-    AsyncSession,
-    async_sessionmaker,
-    create_async_engine,
-)
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from app.models.base import Base
+from app.models.outcome import Outcome
+from app.models.signal import Signal
 
 # ---------------------------------------------------------------------------
 # Test database URL
@@ -25,53 +23,181 @@ TEST_DATABASE_URL = os.environ.get(
     "postgresql+asyncpg://postgres@localhost:5432/goldsignal_test",
 )
 
-# Module-level engine for schema management (create/drop tables)
-_schema_engine = create_async_engine(TEST_DATABASE_URL, echo=False)
-_tables_created = False
 
+# ---------------------------------------------------------------------------
+# Database engine (session-scoped)
+# One engine and one CREATE ALL for the whole run; per-test isolation comes
+# from rolling back an outer transaction rather than a fresh engine.
+# The engine keeps SQLAlchemy's default pool and asyncpg's statement caches:
+# NullPool and disabled caches only paid off while every test built and
+# disposed its own engine. A shared engine reuses its connections, so pooled
+# connections and their prepared statements are reused across tests.
+# ---------------------------------------------------------------------------
+@pytest_asyncio.fixture(scope="session")
+async def db_engine():
+    """Create the test engine and ensure the schema exists once per run."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
 
-async def _ensure_tables():
-    global _tables_created
-    if not _tables_created:
-        async with _schema_engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-        _tables_created = True
+    await engine.dispose()
 
 
 # ---------------------------------------------------------------------------
 # Database session (function-scoped)
-# Each test gets its own engine + session to avoid connection conflicts.
-# Tables are truncated before each test for isolation.
+# Each test runs inside a transaction that is rolled back on teardown.
 # ---------------------------------------------------------------------------
 @pytest_asyncio.fixture
-async def db_session():
+async def db_session(db_engine):
     """Provide an isolated database session for each test.
 
-    Creates a fresh engine per test to avoid asyncpg connection contention.
-    Truncates candles table before the test starts for clean state.
+    The session is bound to a connection with an open outer transaction and
+    joins it via savepoints, so commit() inside code under test only releases
+    a savepoint. Rolling back the outer transaction restores clean state.
     """
-    await _ensure_tables()
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
 
-    engine = create_async_engine(TEST_DATABASE_URL, echo=False, pool_size=2)
-
-    # Clean before each test
-    async with engine.begin() as conn:
+        # Start from an empty table even if a previous run left rows behind;
+        # the delete is undone along with everything else on rollback.
         await conn.execute(text("DELETE FROM candles"))
 
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    session = session_factory()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        yield session
+
+        await session.close()
+        await trans.rollback()
+
+
+# ---------------------------------------------------------------------------
+# Class-scoped connection with per-test savepoints
+# For test classes that seed shared rows once: the seed data lives in the
+# class connection's outer transaction, and each test runs in a savepoint on
+# top of it, so neither needs cleanup statements.
+# ---------------------------------------------------------------------------
+@pytest_asyncio.fixture(scope="class")
+async def db_class_connection(db_engine):
+    """Hold one connection and outer transaction for a whole test class.
+
+    Class-scoped seed fixtures write through this connection; the ROLLBACK
+    once the class finishes discards their rows.
+    """
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        yield conn
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture
+async def db_class_session(db_class_connection):
+    """Provide an isolated session on the class connection for each test.
+
+    Each test runs inside its own SAVEPOINT. The session joins it via further
+    SAVEPOINTs, so commit() in code under test only releases a savepoint, and
+    rolling back the per-test savepoint discards everything the test wrote
+    while keeping the class seed data.
+    """
+    savepoint = await db_class_connection.begin_nested()
+    session = AsyncSession(
+        bind=db_class_connection,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
+    )
 
     yield session
 
     await session.close()
-    await engine.dispose()
+    await savepoint.rollback()
+
+
+# ---------------------------------------------------------------------------
+# Signal + outcome rows (session-scoped helper)
+# ---------------------------------------------------------------------------
+@pytest.fixture(scope="session")
+def bulk_signals_with_outcomes():
+    """Return an async helper inserting one signal + outcome per spec.
+
+    Call it as ``await bulk_signals_with_outcomes(session, strategy_id, specs)``
+    where each spec is (result, pnl_pips, created_at). Every signal is a BUY
+    at 2650.00 (SL 2645.00, TP1 2655.00, TP2 2660.00) with the given
+    risk_reward, and every outcome exits at TP1. Signals are flushed together
+    to obtain their ids, then the outcomes go in as one bulk INSERT; each
+    spec's created_at is set on both rows, overriding the server default.
+
+    The helper never commits: the rows stay in the caller's transaction, and
+    the session fixture decides whether they are kept or rolled back.
+    """
+
+    async def insert_rows(
+        session: AsyncSession,
+        strategy_id: int,
+        specs: list[tuple[str, Decimal, datetime]],
+        risk_reward: Decimal = Decimal("2.00"),
+    ) -> None:
+        signals = [
+            Signal(
+                strategy_id=strategy_id,
+                symbol="XAUUSD",
+                timeframe="H1",
+                direction="BUY",
+                entry_price=Decimal("2650.00"),
+                stop_loss=Decimal("2645.00"),
+                take_profit_1=Decimal("2655.00"),
+                take_profit_2=Decimal("2660.00"),
+                risk_reward=risk_reward,
+                confidence=Decimal("75.00"),
+                reasoning="test",
+                status="active",
+                created_at=created_at,
+            )
+            for _, _, created_at in specs
+        ]
+        session.add_all(signals)
+        await session.flush()
+        await session.execute(
+            insert(Outcome),
+            [
+                {
+                    "signal_id": sig.id,
+                    "result": result,
+                    "exit_price": Decimal("2655.00"),
+                    "pnl_pips": pnl_pips,
+                    "created_at": created_at,
+                }
+                for sig, (result, pnl_pips, created_at) in zip(signals, specs)
+            ],
+        )
+
+    return insert_rows
+
+
+# ---------------------------------------------------------------------------
+# HTTP client (session-scoped)
+# The app object is a module singleton, so one transport and one client serve
+# every test; only the dependency overrides change per test. ASGITransport
+# does not send lifespan events, so bootstrap and the scheduler never run.
+# ---------------------------------------------------------------------------
+@pytest_asyncio.fixture(scope="session")
+async def _http_client():
+    """Open a single AsyncClient over the FastAPI app for the whole run."""
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
 
 
 # ---------------------------------------------------------------------------
 # FastAPI test client (function-scoped)
 # ---------------------------------------------------------------------------
 @pytest_asyncio.fixture
-async def client(db_session):
+async def client(db_session, _http_client):
     """Async HTTP client with test database session injected."""
     from app.database import get_session
     from app.main import app
@@ -81,9 +207,7 @@ async def client(db_session):
 
     app.dependency_overrides[get_session] = _override_get_session
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+    yield _http_client
 
     app.dependency_overrides.clear()
 
@@ -98,6 +222,8 @@ def mock_twelve_data():
     Returns a mock whose .time_series().as_json() yields 5 candles
     with realistic XAUUSD prices.
     """
+    from app.services import candle_ingestor
+
     fake_candles = [
         {
             "datetime": "2026-02-16 10:00:00",
@@ -141,7 +267,7 @@ def mock_twelve_data():
         },
     ]
 
-    with patch("app.services.candle_ingestor.TDClient") as mock_cls:
+    with patch.object(candle_ingestor, "TDClient") as mock_cls:
         mock_instance = MagicMock()
         mock_cls.return_value = mock_instance
 
@@ -210,3 +336,22 @@ def sample_candles():
             "volume": Decimal("2012"),
         },
     ]
+
+
+# ---------------------------------------------------------------------------
+# Event loop
+# Production runs under uvicorn[standard], which serves on uvloop; run the
+# async tests on the same loop. uvloop is absent on Windows, and older
+# pytest-asyncio releases lack this hook (optionalhook), so both fall back to
+# the default asyncio loop.
+# ---------------------------------------------------------------------------
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        return {"uvloop": uvloop.new_event_loop}
@@ -5,10 +5,13 @@ strategy.analyze() integration, and walk-forward overfitting detection.
 All tests are pure unit tests with no database dependencies.
 """
 
-from datetime import datetime, timedelta, timezone
+import dataclasses
+import functools
+from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -16,35 +19,43 @@ from app.services.backtester import BacktestRunner
 from app.services.metrics_calculator import BacktestMetrics
 from app.services.trade_simulator import SimulatedTrade, TradeOutcome, TradeSimulator
 from app.services.walk_forward import WalkForwardResult, WalkForwardValidator
-from app.strategies.base import BaseStrategy, CandidateSignal, Direction, InsufficientDataError
+from app.strategies.base import CandidateSignal, Direction, InsufficientDataError
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=8)
+def _cached_candle_df(n_bars: int, base_price: float) -> pd.DataFrame:
+    """Build the candle frame once per (n_bars, base_price); never handed out."""
+    price = base_price + 0.1 * np.arange(n_bars, dtype=np.float64)
+    return pd.DataFrame({
+        "timestamp": pd.date_range(
+            "2026-01-01", periods=n_bars, freq="h", tz="UTC",
+        ),
+        "open": price,
+        "high": price + 1.0,
+        "low": price - 1.0,
+        "close": price + 0.5,
+    })
+
+
 def _make_candle_df(n_bars: int, base_price: float = 2000.0) -> pd.DataFrame:
-    """Create a simple candle DataFrame with n_bars."""
-    rows = []
-    base_time = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
-    for i in range(n_bars):
-        price = base_price + (i * 0.1)
-        rows.append({
-            "timestamp": base_time + timedelta(hours=i),
-            "open": price,
-            "high": price + 1.0,
-            "low": price - 1.0,
-            "close": price + 0.5,
-        })
-    return pd.DataFrame(rows)
-
-
-def _make_trade(
-    outcome: TradeOutcome = TradeOutcome.TP1_HIT,
-    pnl_pips: float = 50.0,
-) -> SimulatedTrade:
-    """Create a SimulatedTrade for testing."""
-    signal = CandidateSignal(
+    """Create a simple candle DataFrame with n_bars.
+
+    Returns a copy of the cached frame, so callers may mutate it freely.
+    """
+    return _cached_candle_df(n_bars, base_price).copy()
+
+
+# validate() has no length precondition and the runner is mocked in the
+# walk-forward tests, so the frame only needs non-empty 80/20 halves.
+_WF_BARS = 10
+
+
+_PROTO_TP1 = SimulatedTrade(
+    signal=CandidateSignal(
         strategy_name="test",
         symbol="XAUUSD",
         timeframe="H1",
@@ -57,15 +68,108 @@ def _make_trade(
         confidence=Decimal("70.00"),
         reasoning="test",
         timestamp=datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc),
-    )
-    return SimulatedTrade(
-        signal=signal,
-        outcome=outcome,
-        exit_price=Decimal("2005.00"),
-        pnl_pips=Decimal(str(pnl_pips)),
-        bars_held=5,
-        spread_cost=Decimal("0.30"),
-    )
+    ),
+    outcome=TradeOutcome.TP1_HIT,
+    exit_price=Decimal("2005.00"),
+    pnl_pips=Decimal("50.0"),
+    bars_held=5,
+    spread_cost=Decimal("0.30"),
+)
+
+
+class _StubStrategy:
+    """Minimal strategy stand-in that records analyze() calls.
+
+    Avoids MagicMock(spec=BaseStrategy) construction and per-call mock
+    dispatch, which dominates when the runner calls analyze() per window.
+    """
+
+    min_candles = 0
+
+    def __init__(self, ret: list[CandidateSignal] | None = None, name: str = "mock_strategy"):
+        self.name = name
+        self._ret = ret or []
+        self.calls = 0
+
+    def analyze(self, candles: pd.DataFrame) -> list[CandidateSignal]:
+        self.calls += 1
+        return self._ret
+
+
+# Shared per-outcome trades; the validator only reads metric aggregates, so
+# one object can fill every slot of a trade list.
+_PROTO_SL = dataclasses.replace(
+    _PROTO_TP1, outcome=TradeOutcome.SL_HIT, pnl_pips=Decimal("-5.0")
+)
+
+
+# Signal returned by the stub strategy's analyze() in rolling backtests; read
+# only, so one instance is shared.
+_USES_ANALYZE_SIGNAL = CandidateSignal(
+    strategy_name="mock_strategy",
+    symbol="XAUUSD",
+    timeframe="H1",
+    direction=Direction.BUY,
+    entry_price=Decimal("2000.00"),
+    stop_loss=Decimal("1990.00"),
+    take_profit_1=Decimal("2020.00"),
+    take_profit_2=Decimal("2030.00"),
+    risk_reward=Decimal("2.00"),
+    confidence=Decimal("70.00"),
+    reasoning="mock signal",
+    timestamp=datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc),
+)
+
+
+# Walk-forward metric prototypes, built once and shared across parametrized runs
+_METRICS_IS_MODERATE = BacktestMetrics(
+    win_rate=Decimal("0.6"),
+    profit_factor=Decimal("2.0"),
+    sharpe_ratio=Decimal("1.5"),
+    max_drawdown=Decimal("10.0"),
+    expectancy=Decimal("5.0"),
+    total_trades=50,
+)
+_METRICS_OOS_FEW = BacktestMetrics(
+    win_rate=Decimal("0.3"),
+    profit_factor=Decimal("0.5"),
+    sharpe_ratio=Decimal("0.5"),
+    max_drawdown=Decimal("20.0"),
+    expectancy=Decimal("-2.0"),
+    total_trades=3,  # Below MIN_OOS_TRADES (5)
+)
+_METRICS_IS_STRONG = BacktestMetrics(
+    win_rate=Decimal("0.8"),
+    profit_factor=Decimal("3.0"),
+    sharpe_ratio=Decimal("2.0"),
+    max_drawdown=Decimal("5.0"),
+    expectancy=Decimal("10.0"),
+    total_trades=100,
+)
+_METRICS_OOS_DEGRADED = BacktestMetrics(
+    win_rate=Decimal("0.2"),
+    profit_factor=Decimal("0.5"),
+    sharpe_ratio=Decimal("0.3"),
+    max_drawdown=Decimal("30.0"),
+    expectancy=Decimal("-5.0"),
+    total_trades=20,
+)
+
+
+@pytest.fixture
+def wf_runner(request):
+    """Mock BacktestRunner returning (is_metrics, oos_metrics, oos_trade) results.
+
+    Trade lists are sized from each metrics' total_trades; IS trades use the
+    shared TP1 prototype.
+    """
+    is_metrics, oos_metrics, oos_trade = request.param
+    runner = MagicMock(spec=BacktestRunner)
+    runner.run_full_backtest.side_effect = [
+        (is_metrics, [_PROTO_TP1] * is_metrics.total_trades),
+        (oos_metrics, [oos_trade] * oos_metrics.total_trades),
+    ]
+    return runner
 
 
 # ---------------------------------------------------------------------------
@@ -84,54 +188,29 @@ class TestBacktestRunner:
         assert runner.metrics_calculator is not None
         assert isinstance(runner.simulator, TradeSimulator)
 
-    def test_rolling_backtest_insufficient_data(self):
-        """Returns empty trades when candle count is below minimum."""
+    @pytest.mark.parametrize(
+        "n_bars, analyzed",
+        [
+            # Need window_days * 24 + MAX_BARS_FORWARD candles
+            # For window=30: 30*24 + 72 = 792. Provide only 100.
+            (100, False),
+            # Exactly enough data for one window + forward bars, plus one
+            # extra step: 792 + step_candles(24)
+            (30 * 24 + TradeSimulator.MAX_BARS_FORWARD + 24, True),
+        ],
+        ids=["insufficient_data", "uses_analyze"],
+    )
+    def test_rolling_backtest(self, n_bars, analyzed):
+        """analyze() runs on each window (BACK-02 linkage); short data yields no trades."""
         runner = BacktestRunner()
-        strategy = MagicMock(spec=BaseStrategy)
-        strategy.name = "mock_strategy"
-
-        # Need window_days * 24 + MAX_BARS_FORWARD candles
-        # For window=30: 30*24 + 72 = 792. Provide only 100.
-        candles = _make_candle_df(100)
-        trades = runner.run_rolling_backtest(strategy, candles, window_days=30)
-
-        assert trades == []
-        strategy.analyze.assert_not_called()
+        strategy = _StubStrategy(ret=[_USES_ANALYZE_SIGNAL])
 
-    def test_rolling_backtest_uses_analyze(self):
-        """Verifies strategy.analyze() is called on each window (BACK-02 linkage)."""
-        runner = BacktestRunner()
-        strategy = MagicMock(spec=BaseStrategy)
-        strategy.name = "mock_strategy"
-
-        # Create a signal that will be returned by analyze
-        signal = CandidateSignal(
-            strategy_name="mock_strategy",
-            symbol="XAUUSD",
-            timeframe="H1",
-            direction=Direction.BUY,
-            entry_price=Decimal("2000.00"),
-            stop_loss=Decimal("1990.00"),
-            take_profit_1=Decimal("2020.00"),
-            take_profit_2=Decimal("2030.00"),
-            risk_reward=Decimal("2.00"),
-            confidence=Decimal("70.00"),
-            reasoning="mock signal",
-            timestamp=datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc),
-        )
-        strategy.analyze.return_value = [signal]
-
-        # Provide exactly enough data for one window + forward bars
-        # window=30d -> 720 bars + 72 forward = 792 minimum
-        # Need at least 793 for one step (range end is exclusive)
-        # Plus one extra step: need 792 + step_candles(24)
-        n_bars = 30 * 24 + TradeSimulator.MAX_BARS_FORWARD + 24
         candles = _make_candle_df(n_bars)
-
         trades = runner.run_rolling_backtest(strategy, candles, window_days=30)
 
-        # analyze() should have been called at least once
-        assert strategy.analyze.call_count >= 1
+        assert (strategy.calls >= 1) is analyzed
+        if not analyzed:
+            assert trades == []
 
 
 # ---------------------------------------------------------------------------
@@ -141,78 +220,28 @@ class TestBacktestRunner:
 class TestWalkForwardValidator:
     """Tests for WalkForwardValidator."""
 
-    def test_walk_forward_insufficient_oos_trades(self):
-        """When OOS produces fewer than MIN_OOS_TRADES, overfitting is not flagged."""
-        runner = MagicMock(spec=BacktestRunner)
-
-        # IS returns many trades, OOS returns fewer than MIN_OOS_TRADES
-        is_metrics = BacktestMetrics(
-            win_rate=Decimal("0.6"),
-            profit_factor=Decimal("2.0"),
-            sharpe_ratio=Decimal("1.5"),
-            max_drawdown=Decimal("10.0"),
-            expectancy=Decimal("5.0"),
-            total_trades=50,
-        )
-        oos_metrics = BacktestMetrics(
-            win_rate=Decimal("0.3"),
-            profit_factor=Decimal("0.5"),
-            sharpe_ratio=Decimal("0.5"),
-            max_drawdown=Decimal("20.0"),
-            expectancy=Decimal("-2.0"),
-            total_trades=3,  # Below MIN_OOS_TRADES (5)
-        )
-        runner.run_full_backtest.side_effect = [
-            (is_metrics, [_make_trade()] * 50),
-            (oos_metrics, [_make_trade()] * 3),
-        ]
-
-        validator = WalkForwardValidator(runner=runner)
-        strategy = MagicMock(spec=BaseStrategy)
-        strategy.name = "mock_strategy"
-
-        candles = _make_candle_df(2000)
-        result = validator.validate(strategy, candles, window_days=30)
+    @pytest.mark.parametrize(
+        "wf_runner, expected_insufficient, expected_overfitted",
+        [
+            # OOS produces fewer than MIN_OOS_TRADES -> detection skipped
+            ((_METRICS_IS_MODERATE, _METRICS_OOS_FEW, _PROTO_TP1), True, False),
+            # OOS win rate drops from 0.8 to 0.2 (25% = below 50%) -> flagged
+            ((_METRICS_IS_STRONG, _METRICS_OOS_DEGRADED, _PROTO_SL), False, True),
+        ],
+        ids=["insufficient_oos_trades", "detects_overfitting"],
+        indirect=["wf_runner"],
+    )
+    def test_walk_forward(self, wf_runner, expected_insufficient, expected_overfitted):
+        """Overfitting is flagged on OOS degradation, skipped when OOS trades are too few."""
+        validator = WalkForwardValidator(runner=wf_runner)
+        strategy = _StubStrategy()
 
-        assert result.insufficient_oos_trades is True
-        assert result.is_overfitted is False  # Skipped, not flagged
-
-    def test_walk_forward_detects_overfitting(self):
-        """Strategy flagged as overfitted when OOS metrics degrade below 50% of IS."""
-        runner = MagicMock(spec=BacktestRunner)
-
-        # IS has strong metrics
-        is_metrics = BacktestMetrics(
-            win_rate=Decimal("0.8"),
-            profit_factor=Decimal("3.0"),
-            sharpe_ratio=Decimal("2.0"),
-            max_drawdown=Decimal("5.0"),
-            expectancy=Decimal("10.0"),
-            total_trades=100,
-        )
-        # OOS shows major degradation: win_rate drops from 0.8 to 0.2 (25% = below 50%)
-        oos_metrics = BacktestMetrics(
-            win_rate=Decimal("0.2"),
-            profit_factor=Decimal("0.5"),
-            sharpe_ratio=Decimal("0.3"),
-            max_drawdown=Decimal("30.0"),
-            expectancy=Decimal("-5.0"),
-            total_trades=20,
-        )
-        runner.run_full_backtest.side_effect = [
-            (is_metrics, [_make_trade()] * 100),
-            (oos_metrics, [_make_trade(TradeOutcome.SL_HIT, -5.0)] * 20),
-        ]
-
-        validator = WalkForwardValidator(runner=runner)
-        strategy = MagicMock(spec=BaseStrategy)
-        strategy.name = "mock_overfit"
-
-        candles = _make_candle_df(2000)
+        candles = _make_candle_df(_WF_BARS)
         result = validator.validate(strategy, candles, window_days=30)
 
-        assert result.is_overfitted is True
-        assert result.insufficient_oos_trades is False
-        # WFE win rate: 0.2/0.8 = 0.25 < 0.5
-        assert result.wfe_win_rate is not None
-        assert result.wfe_win_rate < WalkForwardValidator.DEGRADATION_THRESHOLD
+        assert result.insufficient_oos_trades is expected_insufficient
+        assert result.is_overfitted is expected_overfitted
+        if expected_overfitted:
+            # WFE win rate: 0.2/0.8 = 0.25 < 0.5
+            assert result.wfe_win_rate is not None
+            assert result.wfe_win_rate < WalkForwardValidator.DEGRADATION_THRESHOLD
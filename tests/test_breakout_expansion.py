@@ -3,8 +3,6 @@
 All tests use synthetic candle data -- no database fixtures required.
 """
 
-import math
-from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import numpy as np
@@ -40,157 +38,126 @@ def make_consolidation_breakout_candles(
 
     All timestamps start at 07:00 UTC (London open for confidence bonus).
     """
-    base_ts = datetime(2026, 1, 1, 7, 0, tzinfo=timezone.utc)
-    rows: list[dict] = []
+    # Each phase is an (open, high, low, close, volume) tuple of arrays,
+    # concatenated and rounded once at the end.
 
     # Phase 1: Normal volatility (bars 0-19)
-    for i in range(20):
-        noise = math.sin(i * 0.5) * 3.0
-        mid = base_price + noise
-        o = mid - 3.0
-        c = mid + 3.0
-        h = max(o, c) + 4.0
-        l = min(o, c) - 4.0
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 2000.0,
-        })
+    mid = base_price + np.sin(np.arange(20) * 0.5) * 3.0
+    o1, c1 = mid - 3.0, mid + 3.0
+    phase1 = (o1, c1 + 4.0, o1 - 4.0, c1, np.full(20, 2000.0))
 
     # Phase 2: Tight consolidation (bars 20-79)
     # ATR should be very small here, and range is ~$5
     consol_mid = base_price
     consol_range = 2.5  # half of $5 range
-    for i in range(20, 80):
-        tiny_noise = math.sin(i * 0.7) * 0.3
-        mid = consol_mid + tiny_noise
-        # Very small candles
-        o = mid - 0.2
-        c = mid + 0.2
-        h = max(o, c) + 0.3
-        l = min(o, c) - 0.3
-        # Keep within consolidation range
-        h = min(h, consol_mid + consol_range)
-        l = max(l, consol_mid - consol_range)
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 800.0,
-        })
+    mid = consol_mid + np.sin(np.arange(20, 80) * 0.7) * 0.3
+    # Very small candles, kept within the consolidation range
+    o2, c2 = mid - 0.2, mid + 0.2
+    phase2 = (
+        o2,
+        np.minimum(c2 + 0.3, consol_mid + consol_range),
+        np.maximum(o2 - 0.3, consol_mid - consol_range),
+        c2,
+        np.full(60, 800.0),
+    )
 
     # Phase 3: Transition bars (80-84) -- still compressed but slightly
     # expanding, to set up breakout detection at bar 85
-    for i in range(80, 85):
-        tiny_noise = math.sin(i * 0.7) * 0.3
-        mid = consol_mid + tiny_noise
-        o = mid - 0.3
-        c = mid + 0.3
-        h = max(o, c) + 0.4
-        l = min(o, c) - 0.4
-        h = min(h, consol_mid + consol_range)
-        l = max(l, consol_mid - consol_range)
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 900.0,
-        })
-
-    # Determine consolidation range from actual data
-    consol_data_highs = [r["high"] for r in rows[20:85]]
-    consol_data_lows = [r["low"] for r in rows[20:85]]
-    range_high = max(consol_data_highs)
-    range_low = min(consol_data_lows)
+    mid = consol_mid + np.sin(np.arange(80, 85) * 0.7) * 0.3
+    o3, c3 = mid - 0.3, mid + 0.3
+    phase3 = (
+        o3,
+        np.minimum(c3 + 0.4, consol_mid + consol_range),
+        np.maximum(o3 - 0.4, consol_mid - consol_range),
+        c3,
+        np.full(5, 900.0),
+    )
+
+    # Determine consolidation range from actual (rounded) data
+    range_high = np.round(np.concatenate([phase2[1], phase3[1]]), 2).max()
+    range_low = np.round(np.concatenate([phase2[2], phase3[2]]), 2).min()
 
     # Phase 4: Breakout (bars 85-90)
+    offset = np.arange(6)
+    volume4 = 5000.0 + offset * 500.0
     if breakout_direction == "up":
-        for i in range(85, 91):
-            offset = i - 85
-            # Large bullish candles breaking above range_high
-            mid = range_high + 5.0 + offset * 4.0
-            o = mid - 3.0
-            c = mid + 4.0
-            h = c + 2.0
-            l = o - 1.0
-            rows.append({
-                "timestamp": base_ts + timedelta(hours=i),
-                "open": round(o, 2),
-                "high": round(h, 2),
-                "low": round(l, 2),
-                "close": round(c, 2),
-                "volume": 5000.0 + offset * 500,
-            })
+        # Large bullish candles breaking above range_high
+        mid = range_high + 5.0 + offset * 4.0
+        o4, c4 = mid - 3.0, mid + 4.0
+        phase4 = (o4, c4 + 2.0, o4 - 1.0, c4, volume4)
     else:  # "down"
-        for i in range(85, 91):
-            offset = i - 85
-            mid = range_low - 5.0 - offset * 4.0
-            o = mid + 3.0
-            c = mid - 4.0
-            h = o + 1.0
-            l = c - 2.0
-            rows.append({
-                "timestamp": base_ts + timedelta(hours=i),
-                "open": round(o, 2),
-                "high": round(h, 2),
-                "low": round(l, 2),
-                "close": round(c, 2),
-                "volume": 5000.0 + offset * 500,
-            })
+        mid = range_low - 5.0 - offset * 4.0
+        o4, c4 = mid + 3.0, mid - 4.0
+        phase4 = (o4, o4 + 1.0, c4 - 2.0, c4, volume4)
 
     # Phase 5: Continuation (bars 91+)
-    last_close = rows[-1]["close"]
-    for i in range(91, count):
-        offset = i - 91
-        if breakout_direction == "up":
-            mid = last_close + offset * 1.0
-        else:
-            mid = last_close - offset * 1.0
-        o = mid - 2.0
-        c = mid + 2.0
-        h = max(o, c) + 2.0
-        l = min(o, c) - 2.0
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 2000.0,
-        })
-
-    return pd.DataFrame(rows)
+    last_close = np.round(phase4[3][-1], 2)
+    offset = np.arange(max(count - 91, 0))
+    if breakout_direction == "up":
+        mid = last_close + offset * 1.0
+    else:
+        mid = last_close - offset * 1.0
+    o5, c5 = mid - 2.0, mid + 2.0
+    phase5 = (o5, c5 + 2.0, o5 - 2.0, c5, np.full(len(offset), 2000.0))
+
+    phases = (phase1, phase2, phase3, phase4, phase5)
+    o, h, l, c, volume = (
+        np.concatenate([phase[k] for phase in phases]) for k in range(5)
+    )
+    return pd.DataFrame({
+        "timestamp": pd.date_range(
+            "2026-01-01 07:00", periods=len(o), freq="h", tz="UTC",
+        ),
+        "open": np.round(o, 2),
+        "high": np.round(h, 2),
+        "low": np.round(l, 2),
+        "close": np.round(c, 2),
+        "volume": volume,
+    })
 
 
 def make_flat_candles(count: int = 120, base_price: float = 2650.0) -> pd.DataFrame:
     """Generate flat candles for basic testing."""
-    base_ts = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
-    rows: list[dict] = []
-
-    for i in range(count):
-        noise = math.sin(i * 0.5) * 2.0
-        mid = base_price + noise
-        o = mid - 1.0
-        c = mid + 1.0
-        h = max(o, c) + 1.5
-        l = min(o, c) - 1.5
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1000.0,
-        })
-
-    return pd.DataFrame(rows)
+    mid = base_price + np.sin(np.arange(count) * 0.5) * 2.0
+    # Bullish bars (close > open), so the wicks hang off close/open directly
+    o = mid - 1.0
+    c = mid + 1.0
+    return pd.DataFrame({
+        "timestamp": pd.date_range(
+            "2026-01-01 10:00", periods=count, freq="h", tz="UTC",
+        ),
+        "open": np.round(o, 2),
+        "high": np.round(c + 1.5, 2),
+        "low": np.round(o - 1.5, 2),
+        "close": np.round(c, 2),
+        "volume": np.full(count, 1000.0),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# Candle generation and analyze() are deterministic, so build each frame and
+# signal list once per module and share them read-only across tests.
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def bullish_candles() -> pd.DataFrame:
+    return make_consolidation_breakout_candles(120, breakout_direction="up")
+
+
+@pytest.fixture(scope="module")
+def bearish_candles() -> pd.DataFrame:
+    return make_consolidation_breakout_candles(120, breakout_direction="down")
+
+
+@pytest.fixture(scope="module")
+def bullish_signals(bullish_candles) -> list[CandidateSignal]:
+    return BreakoutExpansionStrategy().analyze(bullish_candles)
+
+
+@pytest.fixture(scope="module")
+def bearish_signals(bearish_candles) -> list[CandidateSignal]:
+    return BreakoutExpansionStrategy().analyze(bearish_candles)
 
 
 # ---------------------------------------------------------------------------
@@ -230,8 +197,10 @@ class TestDataValidation:
     def test_validate_data_missing_columns(self):
         """DataFrame missing a column raises ValueError."""
         s = BreakoutExpansionStrategy()
-        candles = make_flat_candles(120)
-        bad_candles = candles.drop(columns=["close"])
+        # Column presence is checked before row count, so no rows are needed
+        bad_candles = pd.DataFrame(
+            {"timestamp": [], "open": [], "high": [], "low": [], "volume": []}
+        )
         with pytest.raises(ValueError, match="Missing required columns"):
             s.analyze(bad_candles)
 
@@ -239,42 +208,22 @@ class TestDataValidation:
 class TestAnalyzeReturn:
     """Return type tests."""
 
-    def test_analyze_returns_list(self):
+    def test_analyze_returns_list(self, bullish_candles):
         """analyze() returns a list."""
         s = BreakoutExpansionStrategy()
-        candles = make_consolidation_breakout_candles(120)
-        result = s.analyze(candles)
+        result = s.analyze(bullish_candles)
         assert isinstance(result, list)
 
-    def test_analyze_returns_list_bearish(self):
+    def test_analyze_returns_list_bearish(self, bearish_candles):
         """analyze() returns a list for bearish breakout data."""
         s = BreakoutExpansionStrategy()
-        candles = make_consolidation_breakout_candles(
-            120, breakout_direction="down",
-        )
-        result = s.analyze(candles)
+        result = s.analyze(bearish_candles)
         assert isinstance(result, list)
 
 
 class TestSignalFields:
     """Validate CandidateSignal field correctness."""
 
-    @pytest.fixture
-    def bullish_signals(self) -> list[CandidateSignal]:
-        s = BreakoutExpansionStrategy()
-        candles = make_consolidation_breakout_candles(
-            120, breakout_direction="up",
-        )
-        return s.analyze(candles)
-
-    @pytest.fixture
-    def bearish_signals(self) -> list[CandidateSignal]:
-        s = BreakoutExpansionStrategy()
-        candles = make_consolidation_breakout_candles(
-            120, breakout_direction="down",
-        )
-        return s.analyze(candles)
-
     def test_signal_fields_valid(self, bullish_signals):
         """Validates CandidateSignal field types and ranges."""
         for sig in bullish_signals:
@@ -1,28 +1,24 @@
 """Tests for the /health endpoint."""
 
+import pytest_asyncio
 
-async def test_health_returns_ok(client):
-    """GET /health returns 200 with status ok and database connected."""
+
+@pytest_asyncio.fixture
+async def health_payload(client):
+    """GET /health once and return the decoded body (status code must be 200)."""
     response = await client.get("/health")
     assert response.status_code == 200
+    return response.json()
 
-    data = response.json()
-    assert data["status"] == "ok"
-    assert data["database"] == "connected"
 
-
-async def test_health_response_has_timestamp(client):
-    """Health response includes a UTC timestamp string."""
-    response = await client.get("/health")
-    data = response.json()
-    assert "timestamp" in data
-    # Timestamp should be a parseable ISO 8601 string
-    assert data["timestamp"] is not None
-    assert len(data["timestamp"]) > 0
+async def test_health_returns_ok(health_payload):
+    """GET /health returns 200 with status ok and database connected."""
+    assert health_payload["status"] == "ok"
+    assert health_payload["database"] == "connected"
 
 
-async def test_health_response_has_version(client):
-    """Health response includes version 0.1.0."""
-    response = await client.get("/health")
-    data = response.json()
-    assert data["version"] == "0.1.0"
+async def test_health_response_has_timestamp_and_version(health_payload):
+    """Health response includes a UTC timestamp string and version 0.1.0."""
+    # Timestamp should be a parseable ISO 8601 string
+    assert health_payload.get("timestamp")
+    assert health_payload["version"] == "0.1.0"
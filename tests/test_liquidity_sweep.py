@@ -3,8 +3,7 @@
 All tests use synthetic candle data -- no database fixtures required.
 """
 
-import math
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from decimal import Decimal
 
 import numpy as np
@@ -41,36 +40,47 @@ def make_candles(
     Returns:
         DataFrame with columns [timestamp, open, high, low, close, volume].
     """
-    base_ts = datetime(2026, 1, 1, start_hour, 0, tzinfo=timezone.utc)
-    rows = []
-
-    price = base_price
-    for i in range(count):
-        # Gentle oscillation for flat; drift for trend
-        noise = math.sin(i * 0.3) * 2.0 + math.cos(i * 0.7) * 1.5
-        if trend == "up":
-            drift = i * 0.3
-        elif trend == "down":
-            drift = -i * 0.3
-        else:
-            drift = 0.0
-
-        mid = price + drift + noise
-        o = mid - 0.5
-        c = mid + 0.5
-        h = max(o, c) + abs(noise) * 0.3
-        l = min(o, c) - abs(noise) * 0.3
-
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1000.0 + i * 10,
-        })
-
-    return pd.DataFrame(rows)
+    i = np.arange(count)
+    # Gentle oscillation for flat; drift for trend
+    noise = np.sin(i * 0.3) * 2.0 + np.cos(i * 0.7) * 1.5
+    if trend == "up":
+        drift = i * 0.3
+    elif trend == "down":
+        drift = -i * 0.3
+    else:
+        drift = 0.0
+
+    mid = base_price + drift + noise
+    o = mid - 0.5
+    c = mid + 0.5
+    wick = np.abs(noise) * 0.3
+    return _candle_frame(
+        start_hour,
+        (o, np.maximum(o, c) + wick, np.minimum(o, c) - wick, c, 1000.0 + i * 10.0),
+    )
+
+
+def _candle_frame(start_hour: int, *phases: tuple) -> pd.DataFrame:
+    """Concatenate (open, high, low, close, volume) phases into hourly candles."""
+    o, h, l, c, volume = (
+        np.concatenate([np.atleast_1d(phase[k]) for phase in phases])
+        for k in range(5)
+    )
+    # concatenate() returned fresh arrays, so round them in place
+    for col in (o, h, l, c):
+        np.round(col, 2, out=col)
+    return pd.DataFrame({
+        "timestamp": pd.date_range(
+            datetime(2026, 1, 1, start_hour, 0, tzinfo=timezone.utc),
+            periods=len(o),
+            freq="h",
+        ),
+        "open": o,
+        "high": h,
+        "low": l,
+        "close": c,
+        "volume": volume,
+    })
 
 
 def make_sweep_candles(count: int = 150) -> pd.DataFrame:
@@ -85,122 +95,54 @@ def make_sweep_candles(count: int = 150) -> pd.DataFrame:
 
     All timestamps are in London session (10:00 UTC start, +1h increments).
     """
-    base_ts = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
-    rows: list[dict] = []
+    # Each phase is an (open, high, low, close, volume) tuple of arrays,
+    # rounded up front because later phases build on its closing levels.
 
     # Phase 1: gentle uptrend (bars 0-79)
-    for i in range(80):
-        mid = 2650.0 + i * 0.5 + math.sin(i * 0.5) * 2.0
-        o = mid - 1.0
-        c = mid + 1.0
-        h = c + 1.5
-        l = o - 1.5
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1200.0,
-        })
+    i = np.arange(80)
+    mid = 2650.0 + i * 0.5 + np.sin(i * 0.5) * 2.0
+    o, c = mid - 1.0, mid + 1.0
+    phase1 = (*np.round((o, c + 1.5, o - 1.5, c), 2), np.full(80, 1200.0))
 
     # Phase 2: pullback creating a swing low (bars 80-89)
-    # Descend from last price down to form a clear trough at bar 85
-    last_close = rows[-1]["close"]
-    for i in range(80, 90):
-        offset = i - 80
-        # Descend for 5 bars, then partially recover for next 5
-        if offset < 5:
-            mid = last_close - offset * 3.0
-        else:
-            mid = last_close - 5 * 3.0 + (offset - 5) * 2.5
-        o = mid - 1.0
-        c = mid + 1.0
-        h = c + 1.0
-        l = o - 1.0
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1500.0,
-        })
+    # Descend for 5 bars from the last close, then partially recover for 5
+    offset = np.arange(10)
+    mid = phase1[3][-1] - np.where(
+        offset < 5, offset * 3.0, 5 * 3.0 - (offset - 5) * 2.5,
+    )
+    o, c = mid - 1.0, mid + 1.0
+    phase2 = (*np.round((o, c + 1.0, o - 1.0, c), 2), np.full(10, 1500.0))
 
     # Record the swing low level (deepest point around bar 84-85)
-    swing_low_level = min(r["low"] for r in rows[80:90])
+    swing_low_level = phase2[2].min()
 
     # Phase 3: recovery back up (bars 90-104)
-    last_close = rows[-1]["close"]
-    for i in range(90, 105):
-        offset = i - 90
-        mid = last_close + offset * 1.5
-        o = mid - 1.0
-        c = mid + 1.0
-        h = c + 1.5
-        l = o - 1.5
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1300.0,
-        })
+    mid = phase2[3][-1] + np.arange(15) * 1.5
+    o, c = mid - 1.0, mid + 1.0
+    phase3 = (*np.round((o, c + 1.5, o - 1.5, c), 2), np.full(15, 1300.0))
 
     # Phase 4: THE SWEEP (bar 105)
     # Price wicks below the swing low but closes back above it
-    last_close = rows[-1]["close"]
-    sweep_open = last_close - 2.0
+    sweep_open = phase3[3][-1] - 2.0
     sweep_low = swing_low_level - 5.0   # wick well below
     sweep_close = swing_low_level + 4.0  # close above swing low
     sweep_high = sweep_close + 2.0
-    rows.append({
-        "timestamp": base_ts + timedelta(hours=105),
-        "open": round(sweep_open, 2),
-        "high": round(sweep_high, 2),
-        "low": round(sweep_low, 2),
-        "close": round(sweep_close, 2),
-        "volume": 3000.0,
-    })
+    phase4 = (sweep_open, sweep_high, sweep_low, sweep_close, 3000.0)
 
     # Phase 5: confirmation candles (bars 106-108)
     # Close above the sweep candle's high to confirm bullish reversal
-    for i in range(106, 109):
-        offset = i - 106
-        mid = sweep_high + 3.0 + offset * 2.0
-        o = mid - 1.5
-        c = mid + 2.0  # strong close near high
-        h = c + 0.5
-        l = o - 0.5
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 2500.0,
-        })
+    mid = sweep_high + 3.0 + np.arange(3) * 2.0
+    o = mid - 1.5
+    c = mid + 2.0  # strong close near high
+    phase5 = (*np.round((o, c + 0.5, o - 0.5, c), 2), np.full(3, 2500.0))
 
     # Pad remaining bars with gentle uptrend
-    last_close = rows[-1]["close"]
-    for i in range(109, count):
-        offset = i - 109
-        mid = last_close + offset * 0.5
-        o = mid - 1.0
-        c = mid + 1.0
-        h = c + 1.0
-        l = o - 1.0
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1100.0,
-        })
-
-    return pd.DataFrame(rows)
+    n_pad = max(count - 109, 0)
+    mid = phase5[3][-1] + np.arange(n_pad) * 0.5
+    o, c = mid - 1.0, mid + 1.0
+    pad = (o, c + 1.0, o - 1.0, c, np.full(n_pad, 1100.0))
+
+    return _candle_frame(10, phase1, phase2, phase3, phase4, phase5, pad)
 
 
 def make_bearish_sweep_candles(count: int = 150) -> pd.DataFrame:
@@ -213,117 +155,103 @@ def make_bearish_sweep_candles(count: int = 150) -> pd.DataFrame:
       - Bar 105:     THE SWEEP -- wick above the swing high, close below it
       - Bars 106-108: confirmation candles closing below the sweep candle's low
     """
-    base_ts = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
-    rows: list[dict] = []
-
     # Phase 1: gentle downtrend (bars 0-79)
-    for i in range(80):
-        mid = 2700.0 - i * 0.5 + math.sin(i * 0.5) * 2.0
-        o = mid + 1.0
-        c = mid - 1.0
-        h = o + 1.5
-        l = c - 1.5
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1200.0,
-        })
+    i = np.arange(80)
+    mid = 2700.0 - i * 0.5 + np.sin(i * 0.5) * 2.0
+    o, c = mid + 1.0, mid - 1.0
+    phase1 = (*np.round((o, o + 1.5, c - 1.5, c), 2), np.full(80, 1200.0))
 
     # Phase 2: bounce creating a swing high (bars 80-89)
-    last_close = rows[-1]["close"]
-    for i in range(80, 90):
-        offset = i - 80
-        if offset < 5:
-            mid = last_close + offset * 3.0
-        else:
-            mid = last_close + 5 * 3.0 - (offset - 5) * 2.5
-        o = mid + 1.0
-        c = mid - 1.0
-        h = o + 1.0
-        l = c - 1.0
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1500.0,
-        })
-
-    swing_high_level = max(r["high"] for r in rows[80:90])
+    offset = np.arange(10)
+    mid = phase1[3][-1] + np.where(
+        offset < 5, offset * 3.0, 5 * 3.0 - (offset - 5) * 2.5,
+    )
+    o, c = mid + 1.0, mid - 1.0
+    phase2 = (*np.round((o, o + 1.0, c - 1.0, c), 2), np.full(10, 1500.0))
+
+    swing_high_level = phase2[1].max()
 
     # Phase 3: drift back down (bars 90-104)
-    last_close = rows[-1]["close"]
-    for i in range(90, 105):
-        offset = i - 90
-        mid = last_close - offset * 1.5
-        o = mid + 1.0
-        c = mid - 1.0
-        h = o + 1.5
-        l = c - 1.5
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1300.0,
-        })
+    mid = phase2[3][-1] - np.arange(15) * 1.5
+    o, c = mid + 1.0, mid - 1.0
+    phase3 = (*np.round((o, o + 1.5, c - 1.5, c), 2), np.full(15, 1300.0))
 
     # Phase 4: THE SWEEP (bar 105)
-    last_close = rows[-1]["close"]
-    sweep_open = last_close + 2.0
+    sweep_open = phase3[3][-1] + 2.0
     sweep_high = swing_high_level + 5.0
     sweep_close = swing_high_level - 4.0
     sweep_low = sweep_close - 2.0
-    rows.append({
-        "timestamp": base_ts + timedelta(hours=105),
-        "open": round(sweep_open, 2),
-        "high": round(sweep_high, 2),
-        "low": round(sweep_low, 2),
-        "close": round(sweep_close, 2),
-        "volume": 3000.0,
-    })
+    phase4 = (sweep_open, sweep_high, sweep_low, sweep_close, 3000.0)
 
     # Phase 5: confirmation candles (bars 106-108)
-    for i in range(106, 109):
-        offset = i - 106
-        mid = sweep_low - 3.0 - offset * 2.0
-        o = mid + 1.5
-        c = mid - 2.0  # strong close near low
-        h = o + 0.5
-        l = c - 0.5
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 2500.0,
-        })
+    mid = sweep_low - 3.0 - np.arange(3) * 2.0
+    o = mid + 1.5
+    c = mid - 2.0  # strong close near low
+    phase5 = (*np.round((o, o + 0.5, c - 0.5, c), 2), np.full(3, 2500.0))
 
     # Pad remaining bars
-    last_close = rows[-1]["close"]
-    for i in range(109, count):
-        offset = i - 109
-        mid = last_close - offset * 0.5
-        o = mid + 1.0
-        c = mid - 1.0
-        h = o + 1.0
-        l = c - 1.0
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1100.0,
-        })
-
-    return pd.DataFrame(rows)
+    n_pad = max(count - 109, 0)
+    mid = phase5[3][-1] - np.arange(n_pad) * 0.5
+    o, c = mid + 1.0, mid - 1.0
+    pad = (o, o + 1.0, c - 1.0, c, np.full(n_pad, 1100.0))
+
+    return _candle_frame(10, phase1, phase2, phase3, phase4, phase5, pad)
+
+
+def _price_levels(signals: list[CandidateSignal]) -> list[np.ndarray]:
+    """Return float64 arrays of (stop_loss, entry, TP1, TP2) across signals.
+
+    Prices carry at most a few decimal places, so float64 preserves their
+    strict ordering.
+    """
+    return [
+        np.fromiter(
+            (float(getattr(sig, field)) for sig in signals),
+            dtype=np.float64,
+            count=len(signals),
+        )
+        for field in ("stop_loss", "entry_price", "take_profit_1", "take_profit_2")
+    ]
+
+
+def _assert_ascending(*levels: tuple[np.ndarray, str]) -> None:
+    """Assert each (array, label) level is strictly below the next, per signal."""
+    for (lo, lo_name), (hi, hi_name) in zip(levels, levels[1:]):
+        bad = ~(lo < hi)
+        # The message (and argmax) is only evaluated when the assert fails
+        assert not bad.any(), (
+            f"{lo_name} {lo[bad.argmax()]} should be < {hi_name} {hi[bad.argmax()]} "
+            f"(signal {bad.argmax()})"
+        )
+
+
+# The two fixed sweep scenarios, built once at import and shared read-only;
+# analyze() copies its input, and tests that modify a frame take a .copy().
+_BULLISH_DF = make_sweep_candles(150)
+_BEARISH_DF = make_bearish_sweep_candles(150)
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# analyze() is deterministic, so each scenario's signal list is built once
+# per module and shared read-only across tests.
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def bullish_candles() -> pd.DataFrame:
+    return _BULLISH_DF
+
+
+@pytest.fixture(scope="module")
+def bullish_signals(bullish_candles) -> list[CandidateSignal]:
+    """Produce signals from the bullish sweep scenario."""
+    return LiquiditySweepStrategy().analyze(bullish_candles)
+
+
+@pytest.fixture(scope="module")
+def bearish_signals() -> list[CandidateSignal]:
+    """Produce signals from the bearish sweep scenario."""
+    return LiquiditySweepStrategy().analyze(_BEARISH_DF)
 
 
 # ---------------------------------------------------------------------------
@@ -378,13 +306,10 @@ class TestDataValidation:
 class TestAnalyzeReturnType:
     """Basic return type and structure tests."""
 
-    def test_analyze_returns_list_of_candidate_signals(self):
+    def test_analyze_returns_list_of_candidate_signals(self, bullish_signals):
         """analyze() returns a list; every element is CandidateSignal."""
-        s = LiquiditySweepStrategy()
-        candles = make_sweep_candles(150)
-        result = s.analyze(candles)
-        assert isinstance(result, list)
-        for sig in result:
+        assert isinstance(bullish_signals, list)
+        for sig in bullish_signals:
             assert isinstance(sig, CandidateSignal)
 
     def test_analyze_on_flat_data_returns_list(self):
@@ -398,82 +323,46 @@ class TestAnalyzeReturnType:
 class TestSignalFields:
     """Validate signal field correctness when signals are produced."""
 
-    @pytest.fixture
-    def bullish_signals(self) -> list[CandidateSignal]:
-        """Produce signals from the bullish sweep scenario."""
-        s = LiquiditySweepStrategy()
-        candles = make_sweep_candles(150)
-        return s.analyze(candles)
-
-    @pytest.fixture
-    def bearish_signals(self) -> list[CandidateSignal]:
-        """Produce signals from the bearish sweep scenario."""
-        s = LiquiditySweepStrategy()
-        candles = make_bearish_sweep_candles(150)
-        return s.analyze(candles)
-
-    def test_signal_fields_populated(self, bullish_signals):
-        """When a signal is produced, all required fields have valid values."""
-        # If the synthetic data produces signals, validate them
+    def test_signal_fields_valid(self, bullish_signals):
+        """When a signal is produced, all fields have valid types and values."""
+        # Single pass over the signals covering population, Decimal types,
+        # confidence bounds and positive risk/reward
         for sig in bullish_signals:
             assert sig.direction in (Direction.BUY, Direction.SELL)
+            assert isinstance(sig.entry_price, Decimal)
+            assert isinstance(sig.stop_loss, Decimal)
+            assert isinstance(sig.take_profit_1, Decimal)
+            assert isinstance(sig.take_profit_2, Decimal)
+            assert isinstance(sig.risk_reward, Decimal)
+            assert isinstance(sig.confidence, Decimal)
             assert sig.entry_price > 0
             assert sig.stop_loss > 0
             assert sig.take_profit_1 > 0
             assert sig.take_profit_2 > 0
             assert sig.risk_reward > 0
-            assert 0 <= sig.confidence <= 100
+            assert Decimal("0") <= sig.confidence <= Decimal("100")
             assert len(sig.reasoning) > 0
             assert sig.timestamp is not None
 
     def test_buy_signal_sl_below_entry(self, bullish_signals):
         """For BUY signals: stop_loss < entry_price < take_profit_1 < take_profit_2."""
         buy_signals = [s for s in bullish_signals if s.direction == Direction.BUY]
-        for sig in buy_signals:
-            assert sig.stop_loss < sig.entry_price, (
-                f"SL {sig.stop_loss} should be < entry {sig.entry_price}"
-            )
-            assert sig.entry_price < sig.take_profit_1, (
-                f"Entry {sig.entry_price} should be < TP1 {sig.take_profit_1}"
-            )
-            assert sig.take_profit_1 < sig.take_profit_2, (
-                f"TP1 {sig.take_profit_1} should be < TP2 {sig.take_profit_2}"
-            )
+        sl, entry, tp1, tp2 = _price_levels(buy_signals)
+        _assert_ascending((sl, "SL"), (entry, "entry"), (tp1, "TP1"), (tp2, "TP2"))
 
     def test_sell_signal_sl_above_entry(self, bearish_signals):
         """For SELL signals: take_profit_2 < take_profit_1 < entry_price < stop_loss."""
         sell_signals = [s for s in bearish_signals if s.direction == Direction.SELL]
-        for sig in sell_signals:
-            assert sig.stop_loss > sig.entry_price, (
-                f"SL {sig.stop_loss} should be > entry {sig.entry_price}"
-            )
-            assert sig.entry_price > sig.take_profit_1, (
-                f"Entry {sig.entry_price} should be > TP1 {sig.take_profit_1}"
-            )
-            assert sig.take_profit_1 > sig.take_profit_2, (
-                f"TP1 {sig.take_profit_1} should be > TP2 {sig.take_profit_2}"
-            )
-
-    def test_confidence_bounds(self, bullish_signals):
-        """Confidence is always between 0 and 100."""
-        for sig in bullish_signals:
-            assert Decimal("0") <= sig.confidence <= Decimal("100")
-
-    def test_risk_reward_is_positive(self, bullish_signals):
-        """Risk/reward ratio is positive."""
-        for sig in bullish_signals:
-            assert sig.risk_reward > 0
+        sl, entry, tp1, tp2 = _price_levels(sell_signals)
+        _assert_ascending((tp2, "TP2"), (tp1, "TP1"), (entry, "entry"), (sl, "SL"))
 
 
 class TestSessionFilter:
     """Session filtering tests."""
 
-    def test_session_filter_applied(self):
+    def test_session_filter_applied(self, bullish_signals):
         """All returned signals have timestamps within London or NY session hours."""
-        s = LiquiditySweepStrategy()
-        candles = make_sweep_candles(150)
-        signals = s.analyze(candles)
-        for sig in signals:
+        for sig in bullish_signals:
             hour = sig.timestamp.hour
             # London: 7-16 UTC, New York: 12-21 UTC
             in_london = 7 <= hour < 16
@@ -502,12 +391,9 @@ class TestSessionFilter:
 class TestStrategyName:
     """Strategy name consistency in signals."""
 
-    def test_strategy_name_in_signals(self):
+    def test_strategy_name_in_signals(self, bullish_signals):
         """All signals have strategy_name == 'liquidity_sweep'."""
-        s = LiquiditySweepStrategy()
-        candles = make_sweep_candles(150)
-        signals = s.analyze(candles)
-        for sig in signals:
+        for sig in bullish_signals:
             assert sig.strategy_name == "liquidity_sweep"
 
 
@@ -529,57 +415,33 @@ class TestNoSignalsOnFlatData:
 class TestNoLookahead:
     """Verify no lookahead bias in signal generation."""
 
-    def test_signal_uses_data_up_to_signal_bar(self):
+    def test_signal_uses_data_up_to_signal_bar(self, bullish_candles, bullish_signals):
         """Signals should be deterministic: adding future data should not
         change signals for earlier bars."""
-        s = LiquiditySweepStrategy()
-        full = make_sweep_candles(150)
-        truncated = full.iloc[:130].copy().reset_index(drop=True)
+        truncated = bullish_candles.iloc[:130].copy().reset_index(drop=True)
 
-        signals_full = s.analyze(full)
-        signals_trunc = s.analyze(truncated)
+        signals_full = bullish_signals
+        signals_trunc = LiquiditySweepStrategy().analyze(truncated)
 
         # Filter signals from full that have index <= 129
-        # (timestamp-based: truncated ends at bar 129)
+        # (timestamp-based: truncated ends at bar 129). Signal timestamps are
+        # naive UTC, so parse both lists as UTC and compare/sort as arrays.
         max_ts = truncated["timestamp"].iloc[-1]
-        # Ensure timezone-aware comparison
-        if hasattr(max_ts, 'to_pydatetime'):
-            max_ts = max_ts.to_pydatetime()
-        if max_ts.tzinfo is None:
-            max_ts = max_ts.replace(tzinfo=timezone.utc)
-        early_full = [
-            sig for sig in signals_full
-            if sig.timestamp.replace(tzinfo=timezone.utc) <= max_ts
-            if sig.timestamp is not None
-        ]
+        ts_full = pd.to_datetime([sig.timestamp for sig in signals_full], utc=True)
+        ts_trunc = pd.to_datetime([sig.timestamp for sig in signals_trunc], utc=True)
+        early_idx = np.flatnonzero(ts_full <= max_ts)
 
         # Same number of signals for the overlapping range
-        assert len(early_full) == len(signals_trunc), (
-            f"Lookahead detected: {len(early_full)} signals with full data "
+        assert len(early_idx) == len(signals_trunc), (
+            f"Lookahead detected: {len(early_idx)} signals with full data "
             f"vs {len(signals_trunc)} with truncated data in same range"
         )
 
         # Same entry prices (sorted by timestamp for stable comparison)
-        early_full_sorted = sorted(early_full, key=lambda s: s.timestamp)
-        trunc_sorted = sorted(signals_trunc, key=lambda s: s.timestamp)
-        for sf, st in zip(early_full_sorted, trunc_sorted):
+        early_idx = early_idx[np.argsort(ts_full[early_idx], kind="stable")]
+        trunc_idx = np.argsort(ts_trunc, kind="stable")
+        for i, j in zip(early_idx, trunc_idx):
+            sf, st = signals_full[i], signals_trunc[j]
             assert sf.entry_price == st.entry_price, (
                 f"Entry price mismatch: {sf.entry_price} vs {st.entry_price}"
             )
-
-
-class TestDecimalPrecision:
-    """Price fields use Decimal with proper precision."""
-
-    def test_prices_are_decimal(self):
-        """All price fields are Decimal instances."""
-        s = LiquiditySweepStrategy()
-        candles = make_sweep_candles(150)
-        signals = s.analyze(candles)
-        for sig in signals:
-            assert isinstance(sig.entry_price, Decimal)
-            assert isinstance(sig.stop_loss, Decimal)
-            assert isinstance(sig.take_profit_1, Decimal)
-            assert isinstance(sig.take_profit_2, Decimal)
-            assert isinstance(sig.risk_reward, Decimal)
-            assert isinstance(sig.confidence, Decimal)
@@ -20,36 +20,47 @@ from datetime import datetime, timezone
 # Helpers
 # ---------------------------------------------------------------------------
 
+# The metrics only read outcome, pnl_pips and bars_held, so every trade shares
+# one read-only signal and spread cost.
+_SIGNAL = CandidateSignal(
+    strategy_name="test",
+    symbol="XAUUSD",
+    timeframe="H1",
+    direction=Direction.BUY,
+    entry_price=Decimal("2000.00"),
+    stop_loss=Decimal("1995.00"),
+    take_profit_1=Decimal("2005.00"),
+    take_profit_2=Decimal("2010.00"),
+    risk_reward=Decimal("2.00"),
+    confidence=Decimal("70.00"),
+    reasoning="test",
+    timestamp=datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc),
+)
+_SPREAD = Decimal("0.30")
+
+
 def _make_trade(
     outcome: TradeOutcome,
     pnl_pips: float,
     bars_held: int = 5,
 ) -> SimulatedTrade:
     """Create a SimulatedTrade with the given outcome and PnL."""
-    signal = CandidateSignal(
-        strategy_name="test",
-        symbol="XAUUSD",
-        timeframe="H1",
-        direction=Direction.BUY,
-        entry_price=Decimal("2000.00"),
-        stop_loss=Decimal("1995.00"),
-        take_profit_1=Decimal("2005.00"),
-        take_profit_2=Decimal("2010.00"),
-        risk_reward=Decimal("2.00"),
-        confidence=Decimal("70.00"),
-        reasoning="test",
-        timestamp=datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc),
-    )
     return SimulatedTrade(
-        signal=signal,
+        signal=_SIGNAL,
         outcome=outcome,
-        exit_price=Decimal("2000.00"),
+        exit_price=_SIGNAL.entry_price,
         pnl_pips=Decimal(str(pnl_pips)),
         bars_held=bars_held,
-        spread_cost=Decimal("0.30"),
+        spread_cost=_SPREAD,
     )
 
 
+@pytest.fixture(scope="module")
+def calc() -> MetricsCalculator:
+    """MetricsCalculator holds no state, so one instance serves every test."""
+    return MetricsCalculator()
+
+
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
@@ -57,12 +68,9 @@ def _make_trade(
 class TestMetricsCalculator:
     """Tests for MetricsCalculator.compute()."""
 
-    def setup_method(self):
-        self.calc = MetricsCalculator()
-
-    def test_empty_trades(self):
+    def test_empty_trades(self, calc):
         """Empty trade list produces zeroed metrics."""
-        metrics = self.calc.compute([])
+        metrics = calc.compute([])
 
         assert metrics.total_trades == 0
         assert metrics.win_rate == Decimal("0")
@@ -71,35 +79,35 @@ class TestMetricsCalculator:
         assert metrics.max_drawdown == Decimal("0")
         assert metrics.expectancy == Decimal("0")
 
-    def test_all_winners(self):
+    def test_all_winners(self, calc):
         """All winning trades: win_rate=1.0, capped profit_factor."""
         trades = [
             _make_trade(TradeOutcome.TP1_HIT, 50.0),
             _make_trade(TradeOutcome.TP2_HIT, 100.0),
             _make_trade(TradeOutcome.TP1_HIT, 30.0),
         ]
-        metrics = self.calc.compute(trades)
+        metrics = calc.compute(trades)
 
         assert metrics.win_rate == Decimal("1.0")
         assert metrics.profit_factor == Decimal("9999.9999")
         assert metrics.expectancy > Decimal("0")
         assert metrics.total_trades == 3
 
-    def test_all_losers(self):
+    def test_all_losers(self, calc):
         """All losing trades: win_rate=0.0, negative expectancy."""
         trades = [
             _make_trade(TradeOutcome.SL_HIT, -50.0),
             _make_trade(TradeOutcome.SL_HIT, -30.0),
             _make_trade(TradeOutcome.SL_HIT, -40.0),
         ]
-        metrics = self.calc.compute(trades)
+        metrics = calc.compute(trades)
 
         assert metrics.win_rate == Decimal("0.0")
         assert metrics.profit_factor == Decimal("0")
         assert metrics.expectancy < Decimal("0")
         assert metrics.total_trades == 3
 
-    def test_mixed_trades(self):
+    def test_mixed_trades(self, calc):
         """Mixed wins and losses produce correct ratios."""
         trades = [
             _make_trade(TradeOutcome.TP1_HIT, 50.0),   # win
@@ -107,30 +115,31 @@ class TestMetricsCalculator:
             _make_trade(TradeOutcome.TP2_HIT, 100.0),   # win
             _make_trade(TradeOutcome.EXPIRED, -10.0),    # loss (EXPIRED is not a win)
         ]
-        metrics = self.calc.compute(trades)
+        metrics = calc.compute(trades)
 
         # Win rate: 2 wins (TP1_HIT, TP2_HIT) out of 4 trades
         assert metrics.win_rate == Decimal("0.5")
 
         # Profit factor: gross_profit / gross_loss = 150 / 35
-        expected_pf = round(150.0 / 35.0, 4)
-        assert float(metrics.profit_factor) == pytest.approx(expected_pf, rel=1e-3)
-
         # Expectancy: (50 - 25 + 100 - 10) / 4 = 28.75
-        assert float(metrics.expectancy) == pytest.approx(28.75, rel=1e-3)
+        expected_pf = round(150.0 / 35.0, 4)
+        assert (
+            float(metrics.profit_factor),
+            float(metrics.expectancy),
+        ) == pytest.approx((expected_pf, 28.75), rel=1e-3)
 
         assert metrics.total_trades == 4
 
-    def test_single_trade(self):
+    def test_single_trade(self, calc):
         """Single trade: sharpe_ratio=0 (cannot compute std with n=1)."""
         trades = [_make_trade(TradeOutcome.TP1_HIT, 50.0)]
-        metrics = self.calc.compute(trades)
+        metrics = calc.compute(trades)
 
         assert metrics.sharpe_ratio == Decimal("0")
         assert metrics.win_rate == Decimal("1.0")
         assert metrics.total_trades == 1
 
-    def test_max_drawdown(self):
+    def test_max_drawdown(self, calc):
         """Known PnL sequence produces correct max drawdown."""
         # Sequence: +50, -30, -40, +20 => cumulative: 50, 20, -20, 0
         # Peak at 50, trough at -20 => drawdown = 70
@@ -140,6 +149,6 @@ class TestMetricsCalculator:
             _make_trade(TradeOutcome.SL_HIT, -40.0),
             _make_trade(TradeOutcome.TP1_HIT, 20.0),
         ]
-        metrics = self.calc.compute(trades)
+        metrics = calc.compute(trades)
 
         assert float(metrics.max_drawdown) == pytest.approx(70.0, rel=1e-3)
@@ -4,18 +4,20 @@ Uses mocking to verify pipeline orchestration logic without needing a real
 database. All async methods use AsyncMock, sync methods use MagicMock.
 """
 
+from __future__ import annotations
+
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.models.signal import Signal
-from app.services.gold_intelligence import DXYCorrelation, GoldIntelligence
-from app.services.risk_manager import RiskCheckResult, RiskManager
-from app.services.signal_generator import SignalGenerator
+from app.services.gold_intelligence import DXYCorrelation
+from app.services.risk_manager import RiskCheckResult
 from app.services.signal_pipeline import SignalPipeline
-from app.services.strategy_selector import StrategySelector, StrategyScore, VolatilityRegime
+from app.services.strategy_selector import StrategyScore, VolatilityRegime
 from app.strategies.base import CandidateSignal, Direction
 
 
@@ -24,66 +26,79 @@ from app.strategies.base import CandidateSignal, Direction
 # ---------------------------------------------------------------------------
 
 
+# Default constructor kwargs, built once; Decimal and datetime values are
+# immutable, so every call can share them.
+_CANDIDATE_DEFAULTS = dict(
+    strategy_name="liquidity_sweep_reversal",
+    symbol="XAUUSD",
+    timeframe="H1",
+    direction=Direction.BUY,
+    entry_price=Decimal("2650.00"),
+    stop_loss=Decimal("2645.00"),
+    take_profit_1=Decimal("2660.00"),
+    take_profit_2=Decimal("2670.00"),
+    risk_reward=Decimal("3.00"),
+    confidence=Decimal("75.00"),
+    reasoning="Test signal",
+    timestamp=datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc),
+)
+_STRATEGY_SCORE_DEFAULTS = dict(
+    strategy_name="liquidity_sweep_reversal",
+    strategy_id=1,
+    composite_score=0.85,
+    win_rate=0.65,
+    profit_factor=2.1,
+    sharpe_ratio=1.3,
+    expectancy=0.5,
+    max_drawdown=0.12,
+    total_trades=120,
+    regime=VolatilityRegime.MEDIUM,
+    is_degraded=False,
+    degradation_reason=None,
+)
+
+# Service results the pipeline only reads, shared across tests
+_RISK_REJECT = RiskCheckResult(approved=False, rejection_reason="Daily loss limit")
+_RISK_APPROVE = RiskCheckResult(approved=True, position_size=Decimal("1.50"))
+_DXY_NA = DXYCorrelation(
+    correlation=None, is_divergent=False, available=False, message="N/A"
+)
+
+
 def make_mock_candidate(**overrides) -> CandidateSignal:
     """Create a test CandidateSignal with sensible defaults."""
-    defaults = dict(
-        strategy_name="liquidity_sweep_reversal",
-        symbol="XAUUSD",
-        timeframe="H1",
-        direction=Direction.BUY,
-        entry_price=Decimal("2650.00"),
-        stop_loss=Decimal("2645.00"),
-        take_profit_1=Decimal("2660.00"),
-        take_profit_2=Decimal("2670.00"),
-        risk_reward=Decimal("3.00"),
-        confidence=Decimal("75.00"),
-        reasoning="Test signal",
-        timestamp=datetime(2026, 2, 17, 12, 0, 0, tzinfo=timezone.utc),
-    )
-    defaults.update(overrides)
-    return CandidateSignal(**defaults)
+    return CandidateSignal(**{**_CANDIDATE_DEFAULTS, **overrides})
 
 
 def make_mock_strategy_score(**overrides) -> StrategyScore:
     """Create a test StrategyScore with sensible defaults."""
-    defaults = dict(
-        strategy_name="liquidity_sweep_reversal",
-        strategy_id=1,
-        composite_score=0.85,
-        win_rate=0.65,
-        profit_factor=2.1,
-        sharpe_ratio=1.3,
-        expectancy=0.5,
-        max_drawdown=0.12,
-        total_trades=120,
-        regime=VolatilityRegime.MEDIUM,
-        is_degraded=False,
-        degradation_reason=None,
+    return StrategyScore(**{**_STRATEGY_SCORE_DEFAULTS, **overrides})
+
+
+@pytest.fixture
+def mocked_pipeline():
+    """Create a SignalPipeline with all-mocked services and a mock session.
+
+    Returns (pipeline, session). Each service is a SimpleNamespace holding
+    only the methods the pipeline calls, so there is no spec introspection
+    and a misspelled attribute still raises AttributeError.
+    """
+    selector = SimpleNamespace(
+        select_best=AsyncMock(),
+        select_all_ranked=AsyncMock(return_value=[]),
+        check_h4_confluence=AsyncMock(return_value=False),
     )
-    defaults.update(overrides)
-    return StrategyScore(**defaults)
-
-
-def make_pipeline():
-    """Create a SignalPipeline with all-mocked services."""
-    selector = MagicMock(spec=StrategySelector)
-    generator = MagicMock(spec=SignalGenerator)
-    risk_manager = MagicMock(spec=RiskManager)
-    gold_intel = MagicMock(spec=GoldIntelligence)
-
-    # Set up default async mocks
-    selector.select_best = AsyncMock()
-    selector.check_h4_confluence = AsyncMock(return_value=False)
-    generator.expire_stale_signals = AsyncMock(return_value=0)
-    generator.generate = AsyncMock(return_value=[])
-    generator.validate = AsyncMock(return_value=[])
-    risk_manager.check = AsyncMock(return_value=[])
-    gold_intel.get_dxy_correlation = AsyncMock(
-        return_value=DXYCorrelation(
-            correlation=None, is_divergent=False, available=False, message="N/A"
-        )
+    generator = SimpleNamespace(
+        expire_stale_signals=AsyncMock(return_value=0),
+        generate=AsyncMock(return_value=[]),
+        validate=AsyncMock(return_value=[]),
+        compute_expiry=MagicMock(),
+    )
+    risk_manager = SimpleNamespace(check=AsyncMock(return_value=[]))
+    gold_intel = SimpleNamespace(
+        get_dxy_correlation=AsyncMock(return_value=_DXY_NA),
+        enrich=MagicMock(return_value=[]),
     )
-    gold_intel.enrich = MagicMock(return_value=[])
 
     pipeline = SignalPipeline(selector, generator, risk_manager, gold_intel)
     session = AsyncMock()
@@ -97,9 +112,9 @@ def make_pipeline():
 
 
 @pytest.mark.asyncio
-async def test_pipeline_skips_when_no_strategy_qualifies():
+async def test_pipeline_skips_when_no_strategy_qualifies(mocked_pipeline):
     """Pipeline returns empty list when no strategy qualifies (select_best -> None)."""
-    pipeline, session = make_pipeline()
+    pipeline, session = mocked_pipeline
     pipeline.selector.select_best.return_value = None
 
     result = await pipeline.run(session)
@@ -109,9 +124,9 @@ async def test_pipeline_skips_when_no_strategy_qualifies():
 
 
 @pytest.mark.asyncio
-async def test_pipeline_skips_when_no_candidates():
+async def test_pipeline_skips_when_no_candidates(mocked_pipeline):
     """Pipeline returns empty list when strategy generates no candidates."""
-    pipeline, session = make_pipeline()
+    pipeline, session = mocked_pipeline
     pipeline.selector.select_best.return_value = make_mock_strategy_score()
     pipeline.generator.generate.return_value = []
 
@@ -122,9 +137,9 @@ async def test_pipeline_skips_when_no_candidates():
 
 
 @pytest.mark.asyncio
-async def test_pipeline_filters_all_candidates():
+async def test_pipeline_filters_all_candidates(mocked_pipeline):
     """Pipeline returns empty list when validation filters out all candidates."""
-    pipeline, session = make_pipeline()
+    pipeline, session = mocked_pipeline
     pipeline.selector.select_best.return_value = make_mock_strategy_score()
     pipeline.generator.generate.return_value = [make_mock_candidate()]
     pipeline.generator.validate.return_value = []
@@ -136,17 +151,15 @@ async def test_pipeline_filters_all_candidates():
 
 
 @pytest.mark.asyncio
-async def test_pipeline_risk_rejects_all():
+async def test_pipeline_risk_rejects_all(mocked_pipeline):
     """Pipeline returns empty list when risk manager rejects all candidates."""
-    pipeline, session = make_pipeline()
+    pipeline, session = mocked_pipeline
     candidate = make_mock_candidate()
 
     pipeline.selector.select_best.return_value = make_mock_strategy_score()
     pipeline.generator.generate.return_value = [candidate]
     pipeline.generator.validate.return_value = [candidate]
-    pipeline.risk_manager.check.return_value = [
-        (candidate, RiskCheckResult(approved=False, rejection_reason="Daily loss limit"))
-    ]
+    pipeline.risk_manager.check.return_value = [(candidate, _RISK_REJECT)]
 
     result = await pipeline.run(session)
 
@@ -154,9 +167,9 @@ async def test_pipeline_risk_rejects_all():
 
 
 @pytest.mark.asyncio
-async def test_pipeline_full_flow_produces_signal():
+async def test_pipeline_full_flow_produces_signal(mocked_pipeline):
     """Full happy-path: pipeline generates, validates, risk-checks, enriches, and persists."""
-    pipeline, session = make_pipeline()
+    pipeline, session = mocked_pipeline
     candidate = make_mock_candidate()
     enriched_candidate = make_mock_candidate(
         reasoning="Test signal | London/NY overlap: +5 confidence",
@@ -166,24 +179,17 @@ async def test_pipeline_full_flow_produces_signal():
     pipeline.selector.select_best.return_value = make_mock_strategy_score()
     pipeline.generator.generate.return_value = [candidate]
     pipeline.generator.validate.return_value = [candidate]
-    pipeline.risk_manager.check.return_value = [
-        (candidate, RiskCheckResult(approved=True, position_size=Decimal("1.50")))
-    ]
+    pipeline.risk_manager.check.return_value = [(candidate, _RISK_APPROVE)]
     pipeline.selector.check_h4_confluence.return_value = True
-    pipeline.gold_intel.get_dxy_correlation.return_value = DXYCorrelation(
-        correlation=None, is_divergent=False, available=False, message="N/A"
-    )
+    pipeline.gold_intel.get_dxy_correlation.return_value = _DXY_NA
     pipeline.gold_intel.enrich.return_value = [enriched_candidate]
     pipeline.generator.compute_expiry.return_value = datetime(
         2026, 2, 17, 20, 0, 0, tzinfo=timezone.utc
     )
 
-    # Mock strategy_id lookup
-    mock_strategy_row = MagicMock()
-    mock_strategy_row.id = 1
-    mock_execute_result = MagicMock()
-    mock_execute_result.scalar_one_or_none.return_value = mock_strategy_row
-    session.execute.return_value = mock_execute_result
+    # Stub the strategy_id lookup result
+    strategy_row = SimpleNamespace(id=1)
+    session.execute.return_value = SimpleNamespace(scalar_one_or_none=lambda: strategy_row)
 
     result = await pipeline.run(session)
 
@@ -198,9 +204,9 @@ async def test_pipeline_full_flow_produces_signal():
 
 
 @pytest.mark.asyncio
-async def test_expire_stale_signals_called_first():
+async def test_expire_stale_signals_called_first(mocked_pipeline):
     """Expire stale signals is called before strategy selection."""
-    pipeline, session = make_pipeline()
+    pipeline, session = mocked_pipeline
 
     call_order: list[str] = []
 
@@ -7,6 +7,8 @@ Proves Phase 2 success criteria:
   requires only one class definition and one import line
 """
 
+from __future__ import annotations
+
 import pandas as pd
 import pytest
 
@@ -16,19 +18,41 @@ from app.strategies.trend_continuation import TrendContinuationStrategy
 from app.strategies.breakout_expansion import BreakoutExpansionStrategy
 
 
+# Registered strategy names at collection time; per-strategy tests are
+# parametrized over these so each strategy reports its own result.
+_REGISTRY_NAMES = sorted(BaseStrategy.get_registry())
+
+
+@pytest.fixture(scope="module")
+def registry():
+    """Snapshot of the strategy registry, taken once per module.
+
+    get_registry() returns a copy, so the inline strategy registered by
+    TestZeroChangeExtensibility never appears in it.
+    """
+    return BaseStrategy.get_registry()
+
+
+@pytest.fixture(scope="module")
+def instances(registry):
+    """One default-parameter instance per registered strategy, keyed by name.
+
+    Tests only read the declared attributes, so instances are shared.
+    """
+    return {name: strategy_cls() for name, strategy_cls in registry.items()}
+
+
 class TestRegistryContents:
     """Verify all strategies are registered correctly."""
 
-    def test_registry_has_three_strategies(self):
+    def test_registry_has_three_strategies(self, registry):
         """len(BaseStrategy.get_registry()) == 3."""
-        registry = BaseStrategy.get_registry()
         assert len(registry) == 3, (
             f"Expected 3 strategies, got {len(registry)}: {list(registry.keys())}"
         )
 
-    def test_registry_keys(self):
+    def test_registry_keys(self, registry):
         """Keys are exactly {liquidity_sweep, trend_continuation, breakout_expansion}."""
-        registry = BaseStrategy.get_registry()
         expected = {"liquidity_sweep", "trend_continuation", "breakout_expansion"}
         assert set(registry.keys()) == expected, (
             f"Expected keys {expected}, got {set(registry.keys())}"
@@ -62,60 +86,55 @@ class TestRegistryAccess:
 class TestStrategyAttributes:
     """Verify all strategies declare required attributes."""
 
-    def test_all_strategies_have_required_attributes(self):
+    @pytest.mark.parametrize("name", _REGISTRY_NAMES)
+    def test_all_strategies_have_required_attributes(self, instances, name):
         """Each registered strategy has name (str), required_timeframes (list),
         min_candles (int > 0), and analyze (callable)."""
-        registry = BaseStrategy.get_registry()
-        for name, strategy_cls in registry.items():
-            instance = strategy_cls()
-            assert isinstance(instance.name, str), (
-                f"Strategy '{name}' name is not str"
-            )
-            assert isinstance(instance.required_timeframes, list), (
-                f"Strategy '{name}' required_timeframes is not list"
-            )
-            assert isinstance(instance.min_candles, int), (
-                f"Strategy '{name}' min_candles is not int"
-            )
-            assert instance.min_candles > 0, (
-                f"Strategy '{name}' min_candles should be > 0"
-            )
-            assert callable(instance.analyze), (
-                f"Strategy '{name}' analyze is not callable"
-            )
-
-    def test_all_strategies_have_distinct_names(self):
+        instance = instances[name]
+        assert isinstance(instance.name, str), (
+            f"Strategy '{name}' name is not str"
+        )
+        assert isinstance(instance.required_timeframes, list), (
+            f"Strategy '{name}' required_timeframes is not list"
+        )
+        assert isinstance(instance.min_candles, int), (
+            f"Strategy '{name}' min_candles is not int"
+        )
+        assert instance.min_candles > 0, (
+            f"Strategy '{name}' min_candles should be > 0"
+        )
+        assert callable(instance.analyze), (
+            f"Strategy '{name}' analyze is not callable"
+        )
+
+    def test_all_strategies_have_distinct_names(self, registry):
         """No duplicate names in registry."""
-        registry = BaseStrategy.get_registry()
         names = list(registry.keys())
         assert len(names) == len(set(names)), (
             f"Duplicate strategy names found: {names}"
         )
 
-    def test_each_strategy_declares_min_candles(self):
+    @pytest.mark.parametrize("name", _REGISTRY_NAMES)
+    def test_each_strategy_declares_min_candles(self, instances, name):
         """Every strategy's min_candles is > 0."""
-        registry = BaseStrategy.get_registry()
-        for name, strategy_cls in registry.items():
-            instance = strategy_cls()
-            assert instance.min_candles > 0, (
-                f"Strategy '{name}' min_candles = {instance.min_candles}"
-            )
+        min_candles = instances[name].min_candles
+        assert min_candles > 0, (
+            f"Strategy '{name}' min_candles = {min_candles}"
+        )
 
-    def test_each_strategy_declares_timeframes(self):
+    @pytest.mark.parametrize("name", _REGISTRY_NAMES)
+    def test_each_strategy_declares_timeframes(self, instances, name):
         """Every strategy's required_timeframes is a non-empty list."""
-        registry = BaseStrategy.get_registry()
-        for name, strategy_cls in registry.items():
-            instance = strategy_cls()
-            assert len(instance.required_timeframes) > 0, (
-                f"Strategy '{name}' has empty required_timeframes"
-            )
+        assert len(instances[name].required_timeframes) > 0, (
+            f"Strategy '{name}' has empty required_timeframes"
+        )
 
-    def test_distinct_min_candles_values(self):
+    def test_distinct_min_candles_values(self, instances):
         """Each strategy has distinct min_candles: 100, 200, 70."""
-        ls = LiquiditySweepStrategy()
-        tc = TrendContinuationStrategy()
-        be = BreakoutExpansionStrategy()
-        values = {ls.min_candles, tc.min_candles, be.min_candles}
+        values = {
+            instances[name].min_candles
+            for name in ("liquidity_sweep", "trend_continuation", "breakout_expansion")
+        }
         assert values == {100, 200, 70}, (
             f"Expected min_candles {{100, 200, 70}}, got {values}"
         )
@@ -125,12 +144,13 @@ class TestZeroChangeExtensibility:
     """Prove STRAT-07: adding a new strategy requires zero changes to
     base classes or downstream code."""
 
-    def test_zero_change_extensibility(self):
+    def test_zero_change_extensibility(self, monkeypatch):
         """Create an inline test strategy, verify it auto-registers, then
         clean up. This proves: adding a new strategy = one class definition."""
-        # Record initial registry state
+        # Register into a scratch copy; monkeypatch restores the real registry
+        # on teardown even if an assertion below fails
+        monkeypatch.setattr(BaseStrategy, "_registry", dict(BaseStrategy._registry))
         initial_count = len(BaseStrategy.get_registry())
-        initial_keys = set(BaseStrategy.get_registry().keys())
 
         # Define a new strategy inline
         class DummyTestStrategy(BaseStrategy):
@@ -157,11 +177,3 @@ class TestZeroChangeExtensibility:
         assert instance.name == "test_dummy_extensibility"
         assert instance.required_timeframes == ["M15"]
         assert instance.min_candles == 50
-
-        # Clean up: remove from registry to avoid polluting other tests
-        del BaseStrategy._registry["test_dummy_extensibility"]
-
-        # Verify cleanup
-        registry = BaseStrategy.get_registry()
-        assert "test_dummy_extensibility" not in registry
-        assert set(registry.keys()) == initial_keys
@@ -5,9 +5,14 @@ expired trades, spread adjustment, and no-lookahead bias.
 All tests are pure unit tests with no database dependencies.
 """
 
-from datetime import datetime, timedelta, timezone
+from __future__ import annotations
+
+import functools
+import random
+from datetime import datetime, timezone
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -19,6 +24,28 @@ from app.strategies.base import CandidateSignal, Direction
 # Fixtures
 # ---------------------------------------------------------------------------
 
+# Signal bar timestamp and default signal timestamp; candle i is stamped
+# i hours after it.
+_BASE_TIME = datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc)
+
+
+@functools.lru_cache(maxsize=None)
+def _price(value: str) -> Decimal:
+    """Parse a price literal once; Decimal is immutable, so callers share it."""
+    return Decimal(value)
+
+
+# CandidateSignal kwargs that never vary between tests, built once.
+_SIGNAL_DEFAULTS = dict(
+    strategy_name="test_strategy",
+    symbol="XAUUSD",
+    timeframe="H1",
+    risk_reward=Decimal("2.00"),
+    confidence=Decimal("70.00"),
+    reasoning="test signal",
+)
+
+
 def _make_signal(
     direction: Direction = Direction.BUY,
     entry: str = "2000.00",
@@ -28,178 +55,217 @@ def _make_signal(
     timestamp: datetime | None = None,
 ) -> CandidateSignal:
     """Create a CandidateSignal with sensible defaults."""
-    if timestamp is None:
-        timestamp = datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc)
     return CandidateSignal(
-        strategy_name="test_strategy",
-        symbol="XAUUSD",
-        timeframe="H1",
         direction=direction,
-        entry_price=Decimal(entry),
-        stop_loss=Decimal(sl),
-        take_profit_1=Decimal(tp1),
-        take_profit_2=Decimal(tp2),
-        risk_reward=Decimal("2.00"),
-        confidence=Decimal("70.00"),
-        reasoning="test signal",
-        timestamp=timestamp,
+        entry_price=_price(entry),
+        stop_loss=_price(sl),
+        take_profit_1=_price(tp1),
+        take_profit_2=_price(tp2),
+        timestamp=_BASE_TIME if timestamp is None else timestamp,
+        **_SIGNAL_DEFAULTS,
     )
 
 
-def _make_candles(ohlc_list: list[tuple[float, float, float, float]]) -> pd.DataFrame:
-    """Create a candle DataFrame from a list of (open, high, low, close) tuples."""
-    rows = []
-    base_time = datetime(2026, 2, 16, 10, 0, tzinfo=timezone.utc)
-    for i, (o, h, l, c) in enumerate(ohlc_list):
-        rows.append({
-            "timestamp": base_time + timedelta(hours=i),
-            "open": o,
-            "high": h,
-            "low": l,
-            "close": c,
-        })
-    return pd.DataFrame(rows)
+@functools.lru_cache(maxsize=None)
+def _make_candles(ohlc: tuple[tuple[float, float, float, float], ...]) -> pd.DataFrame:
+    """Create a candle DataFrame from a tuple of (open, high, low, close) tuples.
+
+    Cached per ohlc tuple; simulate_trade only reads the frame, so callers
+    share it and must not mutate it.
+    """
+    arr = np.asarray(ohlc, dtype=np.float64)
+    return pd.DataFrame({
+        "timestamp": pd.date_range(_BASE_TIME, periods=len(arr), freq="h"),
+        "open": arr[:, 0],
+        "high": arr[:, 1],
+        "low": arr[:, 2],
+        "close": arr[:, 3],
+    })
+
+
+def _make_constant_candles(o: float, h: float, l: float, c: float, n: int) -> pd.DataFrame:
+    """Create n identical (open, high, low, close) candles from filled columns."""
+    return pd.DataFrame({
+        "timestamp": pd.date_range(_BASE_TIME, periods=n, freq="h"),
+        "open": np.full(n, o, dtype=np.float64),
+        "high": np.full(n, h, dtype=np.float64),
+        "low": np.full(n, l, dtype=np.float64),
+        "close": np.full(n, c, dtype=np.float64),
+    })
+
+
+def _expected_outcome(
+    direction: Direction,
+    sl: float,
+    tp1: float,
+    tp2: float,
+    candles: pd.DataFrame,
+    spread: float,
+) -> tuple[TradeOutcome, Decimal, int]:
+    """Reference (outcome, exit_price, bars_held) for a trade from bar 0.
+
+    Evaluates every forward bar at once: builds SL/TP2/TP1 hit masks over
+    the high/low columns, takes the first bar where any fires, and applies
+    the simulator's SL > TP2 > TP1 priority on that bar.
+    """
+    forward = candles.iloc[1:1 + TradeSimulator.MAX_BARS_FORWARD]
+    highs = forward["high"].to_numpy()
+    lows = forward["low"].to_numpy()
+    if direction == Direction.BUY:
+        sl_hit, tp2_hit, tp1_hit = lows <= sl, highs >= tp2, highs >= tp1
+    else:
+        sl_hit, tp2_hit, tp1_hit = highs + spread >= sl, lows <= tp2, lows <= tp1
+
+    any_hit = sl_hit | tp2_hit | tp1_hit
+    if not any_hit.any():
+        exit_price = float(forward["close"].iloc[-1])
+        return TradeOutcome.EXPIRED, Decimal(str(round(exit_price, 2))), len(forward)
+
+    k = int(np.argmax(any_hit))
+    if sl_hit[k]:
+        outcome, exit_price = TradeOutcome.SL_HIT, sl
+    elif tp2_hit[k]:
+        outcome, exit_price = TradeOutcome.TP2_HIT, tp2
+    else:
+        outcome, exit_price = TradeOutcome.TP1_HIT, tp1
+    return outcome, Decimal(str(round(exit_price, 2))), k + 1
+
+
+def _random_cases(n: int, seed: int = 0) -> list[tuple]:
+    """Seeded random-walk scenarios as (direction, levels, ohlc) cases.
+
+    Walk lengths (5-40 bars) and SL/TP distances vary, so the set mixes SL,
+    TP1, TP2 and expiry exits for both directions.
+    """
+    rng = random.Random(seed)
+    cases = []
+    for idx in range(n):
+        direction = Direction.BUY if idx % 2 == 0 else Direction.SELL
+        sign = 1 if direction == Direction.BUY else -1
+        risk = rng.uniform(3.0, 10.0)
+        reward = risk * rng.uniform(0.5, 1.5)
+        # A narrow TP1-TP2 gap lets a single wide bar jump straight to TP2
+        tp2_gap = rng.uniform(0.1, 2.0)
+        entry = 2000.0
+        levels = tuple(
+            f"{level:.2f}"
+            for level in (
+                entry,
+                entry - sign * risk,
+                entry + sign * reward,
+                entry + sign * (reward + tp2_gap),
+            )
+        )
+
+        ohlc = []
+        close = entry
+        for _ in range(rng.randint(5, 40)):
+            o = close
+            close = round(o + rng.uniform(-3.0, 3.0), 2)
+            h = round(max(o, close) + rng.uniform(0.0, 2.0), 2)
+            l = round(min(o, close) - rng.uniform(0.0, 2.0), 2)
+            ohlc.append((o, h, l, close))
+        cases.append((direction, levels, tuple(ohlc)))
+    return cases
 
 
 # ---------------------------------------------------------------------------
 # Tests
 # ---------------------------------------------------------------------------
 
-class TestTradeSimulator:
-    """Tests for TradeSimulator.simulate_trade()."""
-
-    def setup_method(self):
-        self.sim = TradeSimulator()
-
-    def test_buy_tp1_hit(self):
-        """BUY signal where TP1 is reached -- positive PnL."""
-        signal = _make_signal(
-            direction=Direction.BUY,
-            entry="2000.00",
-            sl="1995.00",
-            tp1="2005.00",
-            tp2="2015.00",
-        )
-        # Bar 0 = signal bar. Bar 1 reaches TP1 (high >= 2005).
-        candles = _make_candles([
-            (2000, 2001, 1999, 2000),  # bar 0 (signal bar)
-            (2001, 2006, 2000, 2005),  # bar 1: high=2006 >= tp1=2005
-        ])
-        spread = Decimal("0.30")
-        trade = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
-
-        assert trade.outcome == TradeOutcome.TP1_HIT
-        assert trade.exit_price == Decimal("2005.00")
-        assert trade.pnl_pips > 0
-        assert trade.bars_held == 1
-
-    def test_buy_tp2_hit(self):
-        """BUY signal where TP2 is reached (before TP1 check)."""
-        signal = _make_signal(
-            direction=Direction.BUY,
-            entry="2000.00",
-            sl="1995.00",
-            tp1="2005.00",
-            tp2="2010.00",
-        )
-        # Bar 1 high reaches TP2 (high >= 2010), so TP2 is checked first
-        candles = _make_candles([
-            (2000, 2001, 1999, 2000),  # bar 0 (signal bar)
-            (2001, 2012, 2000, 2010),  # bar 1: high=2012 >= tp2=2010
-        ])
-        spread = Decimal("0.30")
-        trade = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
-
-        assert trade.outcome == TradeOutcome.TP2_HIT
-        assert trade.exit_price == Decimal("2010.00")
-        assert trade.pnl_pips > 0
-
-    def test_buy_sl_hit(self):
-        """BUY signal where SL is hit -- negative PnL."""
-        signal = _make_signal(
-            direction=Direction.BUY,
-            entry="2000.00",
-            sl="1995.00",
-            tp1="2005.00",
-            tp2="2010.00",
-        )
-        # Bar 1: low <= SL (1994 <= 1995)
-        candles = _make_candles([
-            (2000, 2001, 1999, 2000),  # bar 0
-            (2000, 2001, 1994, 1996),  # bar 1: low=1994 <= sl=1995
-        ])
-        spread = Decimal("0.30")
-        trade = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
-
-        assert trade.outcome == TradeOutcome.SL_HIT
-        assert trade.exit_price == Decimal("1995.00")
-        assert trade.pnl_pips < 0
-
-    def test_sell_tp1_hit(self):
-        """SELL signal where TP1 is reached -- positive PnL."""
-        signal = _make_signal(
-            direction=Direction.SELL,
-            entry="2000.00",
-            sl="2005.00",
-            tp1="1995.00",
-            tp2="1990.00",
-        )
-        # Bar 1: low <= tp1 (1994 <= 1995)
-        candles = _make_candles([
-            (2000, 2001, 1999, 2000),  # bar 0
-            (2000, 2001, 1994, 1996),  # bar 1: low=1994 <= tp1=1995
-        ])
-        spread = Decimal("0.30")
-        trade = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
-
-        assert trade.outcome == TradeOutcome.TP1_HIT
-        assert trade.exit_price == Decimal("1995.00")
-        assert trade.pnl_pips > 0
-
-    def test_sell_sl_hit(self):
-        """SELL signal where SL is hit -- negative PnL."""
-        signal = _make_signal(
-            direction=Direction.SELL,
-            entry="2000.00",
-            sl="2005.00",
-            tp1="1995.00",
-            tp2="1990.00",
-        )
-        # Bar 1: high + spread >= SL (2004 + 0.30 = 2004.30 < 2005, try bar 2)
-        # Bar 2: high + spread >= SL (2005 + 0.30 = 2005.30 >= 2005)
-        candles = _make_candles([
-            (2000, 2001, 1999, 2000),  # bar 0
-            (2001, 2002, 2000, 2001),  # bar 1: no hit
-            (2002, 2005, 2001, 2004),  # bar 2: high=2005, 2005+0.30=2005.30 >= sl=2005
-        ])
-        spread = Decimal("0.30")
-        trade = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
+@pytest.fixture(scope="module")
+def sim():
+    """Shared TradeSimulator; it holds no per-trade state."""
+    return TradeSimulator()
 
-        assert trade.outcome == TradeOutcome.SL_HIT
-        assert trade.exit_price == Decimal("2005.00")
-        assert trade.pnl_pips < 0
 
-    def test_sl_priority_over_tp(self):
-        """When both SL and TP could be hit in the same bar, SL wins."""
-        signal = _make_signal(
-            direction=Direction.BUY,
-            entry="2000.00",
-            sl="1995.00",
-            tp1="2005.00",
-            tp2="2010.00",
-        )
-        # Bar 1: both SL and TP1 could trigger (low <= SL AND high >= TP1)
-        candles = _make_candles([
-            (2000, 2001, 1999, 2000),  # bar 0
-            (2000, 2006, 1994, 2000),  # bar 1: low=1994<=1995 AND high=2006>=2005
-        ])
-        spread = Decimal("0.30")
-        trade = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
-
-        # SL takes priority (conservative assumption per BACK-01 decision)
-        assert trade.outcome == TradeOutcome.SL_HIT
+class TestTradeSimulator:
+    """Tests for TradeSimulator.simulate_trade()."""
 
-    def test_expired_no_hit(self):
+    @pytest.mark.parametrize(
+        "direction, levels, ohlc, expected_outcome, expected_exit",
+        [
+            # Bar 0 = signal bar. Bar 1 reaches TP1 (high=2006 >= tp1=2005).
+            (
+                Direction.BUY,
+                ("2000.00", "1995.00", "2005.00", "2015.00"),
+                ((2000, 2001, 1999, 2000), (2001, 2006, 2000, 2005)),
+                TradeOutcome.TP1_HIT,
+                Decimal("2005.00"),
+            ),
+            # Bar 1 high reaches TP2 (high=2012 >= tp2=2010), so TP2 is checked first
+            (
+                Direction.BUY,
+                ("2000.00", "1995.00", "2005.00", "2010.00"),
+                ((2000, 2001, 1999, 2000), (2001, 2012, 2000, 2010)),
+                TradeOutcome.TP2_HIT,
+                Decimal("2010.00"),
+            ),
+            # Bar 1: low <= SL (1994 <= 1995)
+            (
+                Direction.BUY,
+                ("2000.00", "1995.00", "2005.00", "2010.00"),
+                ((2000, 2001, 1999, 2000), (2000, 2001, 1994, 1996)),
+                TradeOutcome.SL_HIT,
+                Decimal("1995.00"),
+            ),
+            # Bar 1: low <= tp1 (1994 <= 1995)
+            (
+                Direction.SELL,
+                ("2000.00", "2005.00", "1995.00", "1990.00"),
+                ((2000, 2001, 1999, 2000), (2000, 2001, 1994, 1996)),
+                TradeOutcome.TP1_HIT,
+                Decimal("1995.00"),
+            ),
+            # Bar 1: high + spread = 2002.30 < sl=2005, no hit.
+            # Bar 2: high + spread = 2005.30 >= sl=2005.
+            (
+                Direction.SELL,
+                ("2000.00", "2005.00", "1995.00", "1990.00"),
+                (
+                    (2000, 2001, 1999, 2000),
+                    (2001, 2002, 2000, 2001),
+                    (2002, 2005, 2001, 2004),
+                ),
+                TradeOutcome.SL_HIT,
+                Decimal("2005.00"),
+            ),
+            # Bar 1: low=1994 <= sl=1995 AND high=2006 >= tp1=2005. SL takes
+            # priority (conservative assumption per BACK-01 decision).
+            (
+                Direction.BUY,
+                ("2000.00", "1995.00", "2005.00", "2010.00"),
+                ((2000, 2001, 1999, 2000), (2000, 2006, 1994, 2000)),
+                TradeOutcome.SL_HIT,
+                Decimal("1995.00"),
+            ),
+        ],
+        ids=[
+            "buy_tp1_hit",
+            "buy_tp2_hit",
+            "buy_sl_hit",
+            "sell_tp1_hit",
+            "sell_sl_hit",
+            "sl_priority_over_tp",
+        ],
+    )
+    def test_exit_outcome(self, sim, direction, levels, ohlc, expected_outcome, expected_exit):
+        """The first bar after the signal to touch SL/TP decides outcome, exit and PnL sign."""
+        entry, sl, tp1, tp2 = levels
+        signal = _make_signal(direction=direction, entry=entry, sl=sl, tp1=tp1, tp2=tp2)
+        candles = _make_candles(ohlc)
+        trade = sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=Decimal("0.30"))
+
+        assert trade.outcome == expected_outcome
+        assert trade.exit_price == expected_exit
+        if expected_outcome == TradeOutcome.SL_HIT:
+            assert trade.pnl_pips < 0
+        else:
+            assert trade.pnl_pips > 0
+        if expected_outcome == TradeOutcome.TP1_HIT:
+            assert trade.bars_held == 1
+
+    def test_expired_no_hit(self, sim):
         """No SL or TP hit within MAX_BARS_FORWARD -- trade expires."""
         signal = _make_signal(
             direction=Direction.BUY,
@@ -210,16 +276,15 @@ class TestTradeSimulator:
         )
         # Create enough bars that all are within safe range (no SL/TP hit)
         bar_count = TradeSimulator.MAX_BARS_FORWARD + 1  # signal bar + forward bars
-        ohlc = [(2000, 2001, 1999, 2000)] * bar_count
-        candles = _make_candles(ohlc)
+        candles = _make_constant_candles(2000, 2001, 1999, 2000, bar_count)
         spread = Decimal("0.30")
 
-        trade = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
+        trade = sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
 
         assert trade.outcome == TradeOutcome.EXPIRED
         assert trade.bars_held == TradeSimulator.MAX_BARS_FORWARD
 
-    def test_spread_adjusts_buy_entry(self):
+    def test_spread_adjusts_buy_entry(self, sim):
         """Spread increases effective entry for BUY, reducing net PnL."""
         signal = _make_signal(
             direction=Direction.BUY,
@@ -228,22 +293,22 @@ class TestTradeSimulator:
             tp1="2005.00",
             tp2="2010.00",
         )
-        candles = _make_candles([
+        candles = _make_candles((
             (2000, 2001, 1999, 2000),  # bar 0
             (2001, 2006, 2000, 2005),  # bar 1: TP1 hit
-        ])
+        ))
 
         # With zero spread
-        trade_zero = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=Decimal("0"))
+        trade_zero = sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=Decimal("0"))
         # With 0.50 spread
-        trade_spread = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=Decimal("0.50"))
+        trade_spread = sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=Decimal("0.50"))
 
         # Both should hit TP1 but spread version has lower PnL
         assert trade_zero.outcome == TradeOutcome.TP1_HIT
         assert trade_spread.outcome == TradeOutcome.TP1_HIT
         assert trade_spread.pnl_pips < trade_zero.pnl_pips
 
-    def test_no_lookahead(self):
+    def test_no_lookahead(self, sim):
         """Bar 0 (signal bar) is NOT checked for SL/TP -- only bar 1+."""
         signal = _make_signal(
             direction=Direction.BUY,
@@ -254,14 +319,29 @@ class TestTradeSimulator:
         )
         # Bar 0 has SL-triggering low AND TP-triggering high, but should NOT be checked
         # Bar 1 is neutral, bar 2 hits TP1
-        candles = _make_candles([
+        candles = _make_candles((
             (2000, 2020, 1990, 2000),  # bar 0: would trigger SL and TP, but is signal bar
             (2001, 2002, 2000, 2001),  # bar 1: neutral
             (2001, 2006, 2000, 2005),  # bar 2: TP1 hit
-        ])
+        ))
         spread = Decimal("0.30")
-        trade = self.sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
+        trade = sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
 
         # Should skip bar 0 and find TP1 on bar 2
         assert trade.outcome == TradeOutcome.TP1_HIT
         assert trade.bars_held == 2
+
+    @pytest.mark.parametrize("direction, levels, ohlc", _random_cases(20))
+    def test_matches_reference_outcome(self, sim, direction, levels, ohlc):
+        """simulate_trade agrees with the array-based reference on random walks."""
+        entry, sl, tp1, tp2 = levels
+        signal = _make_signal(direction=direction, entry=entry, sl=sl, tp1=tp1, tp2=tp2)
+        candles = _make_candles(ohlc)
+        spread = Decimal("0.30")
+
+        trade = sim.simulate_trade(signal, candles, signal_bar_idx=0, spread=spread)
+
+        expected = _expected_outcome(
+            direction, float(sl), float(tp1), float(tp2), candles, float(spread),
+        )
+        assert (trade.outcome, trade.exit_price, trade.bars_held) == expected
@@ -3,8 +3,7 @@
 All tests use synthetic candle data -- no database fixtures required.
 """
 
-import math
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from decimal import Decimal
 
 import numpy as np
@@ -43,111 +42,126 @@ def make_trending_candles(
     All timestamps start at 10:00 UTC (London session).
     """
     base_ts = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
-    rows: list[dict] = []
-
-    if direction == "up":
-        for i in range(count):
-            # Steady uptrend with small noise
-            trend_drift = i * 0.5
-            noise = math.sin(i * 0.3) * 1.5
-
-            if 216 <= i <= 225:
-                # Pullback zone: flatten / slight dip toward EMA-50 zone
-                # EMA-50 should be roughly at base_price + (i-25) * 0.5
-                # Pull price down toward that level
-                pullback_depth = (i - 216) * -1.5
-                trend_drift = 216 * 0.5 + pullback_depth
-                noise *= 0.3  # reduce noise during pullback
-            elif 226 <= i <= 230:
-                # Momentum resumption: strong green candles
-                trend_drift = 216 * 0.5 - 10 * 1.5 + (i - 226) * 3.0
-                noise = 0.5
-
-            mid = base_price + trend_drift + noise
-
-            if 226 <= i <= 230:
-                # Strong bullish candles for confirmation
-                o = mid - 2.0
-                c = mid + 3.0
-                h = c + 1.0
-                l = o - 0.5
-            else:
-                o = mid - 1.0
-                c = mid + 1.0
-                h = max(o, c) + abs(noise) * 0.3 + 1.0
-                l = min(o, c) - abs(noise) * 0.3 - 1.0
-
-            rows.append({
-                "timestamp": base_ts + timedelta(hours=i),
-                "open": round(o, 2),
-                "high": round(h, 2),
-                "low": round(l, 2),
-                "close": round(c, 2),
-                "volume": 1000.0 + i * 5,
-            })
-    else:  # "down"
-        for i in range(count):
-            trend_drift = -i * 0.5
-            noise = math.sin(i * 0.3) * 1.5
-
-            if 216 <= i <= 225:
-                # Pullback zone: prices rise back toward EMA-50
-                pullback_depth = (i - 216) * 1.5
-                trend_drift = -216 * 0.5 + pullback_depth
-                noise *= 0.3
-            elif 226 <= i <= 230:
-                # Bearish confirmation: strong red candles
-                trend_drift = -216 * 0.5 + 10 * 1.5 - (i - 226) * 3.0
-                noise = -0.5
-
-            mid = base_price + trend_drift + noise
-
-            if 226 <= i <= 230:
-                # Strong bearish candles for confirmation
-                o = mid + 2.0
-                c = mid - 3.0
-                h = o + 0.5
-                l = c - 1.0
-            else:
-                o = mid + 1.0
-                c = mid - 1.0
-                h = max(o, c) + abs(noise) * 0.3 + 1.0
-                l = min(o, c) - abs(noise) * 0.3 - 1.0
-
-            rows.append({
-                "timestamp": base_ts + timedelta(hours=i),
-                "open": round(o, 2),
-                "high": round(h, 2),
-                "low": round(l, 2),
-                "close": round(c, 2),
-                "volume": 1000.0 + i * 5,
-            })
-
-    return pd.DataFrame(rows)
+    # +1 for an uptrend, -1 mirrors every offset for a downtrend
+    sign = 1.0 if direction == "up" else -1.0
+    i = np.arange(count, dtype=np.float64)
+    pullback = (i >= 216) & (i <= 225)
+    momentum = (i >= 226) & (i <= 230)
+
+    # Steady trend with small noise
+    trend_drift = sign * i * 0.5
+    noise = np.sin(i * 0.3) * 1.5
+
+    # Pullback zone: drift back toward the EMA-50 zone with damped noise
+    trend_drift = np.where(pullback, sign * (216 * 0.5 - (i - 216) * 1.5), trend_drift)
+    noise = np.where(pullback, noise * 0.3, noise)
+
+    # Momentum resumption: strong candles in the trend direction
+    trend_drift = np.where(momentum, sign * (216 * 0.5 - 10 * 1.5 + (i - 226) * 3.0), trend_drift)
+    noise = np.where(momentum, sign * 0.5, noise)
+
+    mid = base_price + trend_drift + noise
+
+    # Confirmation candles: 5-point body with asymmetric wicks; elsewhere a
+    # 2-point body with noise-scaled wicks
+    o = np.where(momentum, mid - sign * 2.0, mid - sign * 1.0)
+    c = np.where(momentum, mid + sign * 3.0, mid + sign * 1.0)
+    wick = np.abs(noise) * 0.3
+    upper_wick = np.where(momentum, 1.0 if direction == "up" else 0.5, wick + 1.0)
+    lower_wick = np.where(momentum, 0.5 if direction == "up" else 1.0, wick + 1.0)
+    h = np.maximum(o, c) + upper_wick
+    l = np.minimum(o, c) - lower_wick
+    # All four are fresh arrays, so round them in place
+    for col in (o, h, l, c):
+        np.round(col, 2, out=col)
+
+    return pd.DataFrame({
+        "timestamp": pd.date_range(base_ts, periods=count, freq="h"),
+        "open": o,
+        "high": h,
+        "low": l,
+        "close": c,
+        "volume": 1000.0 + i * 5,
+    })
 
 
 def make_flat_candles(count: int = 250, base_price: float = 2600.0) -> pd.DataFrame:
     """Generate flat, non-trending candles for false-positive testing."""
     base_ts = datetime(2026, 1, 1, 10, 0, tzinfo=timezone.utc)
-    rows: list[dict] = []
-
-    for i in range(count):
-        noise = math.sin(i * 0.5) * 2.0
-        mid = base_price + noise
-        o = mid - 0.5
-        c = mid + 0.5
-        h = max(o, c) + 1.0
-        l = min(o, c) - 1.0
-        rows.append({
-            "timestamp": base_ts + timedelta(hours=i),
-            "open": round(o, 2),
-            "high": round(h, 2),
-            "low": round(l, 2),
-            "close": round(c, 2),
-            "volume": 1000.0,
-        })
-
-    return pd.DataFrame(rows)
+    i = np.arange(count, dtype=np.float64)
+
+    mid = base_price + np.sin(i * 0.5) * 2.0
+    o = mid - 0.5
+    c = mid + 0.5
+    h = np.maximum(o, c) + 1.0
+    l = np.minimum(o, c) - 1.0
+    for col in (o, h, l, c):
+        np.round(col, 2, out=col)
+
+    return pd.DataFrame({
+        "timestamp": pd.date_range(base_ts, periods=count, freq="h"),
+        "open": o,
+        "high": h,
+        "low": l,
+        "close": c,
+        "volume": np.full(count, 1000.0),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# The generators and analyze() are deterministic and analyze() works on a
+# copy of its input, so each frame and signal list is built once per module
+# and shared read-only.
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def strategy() -> TrendContinuationStrategy:
+    """Shared default-parameter strategy; analyze() keeps no per-call state."""
+    return TrendContinuationStrategy()
+
+
+@pytest.fixture(scope="module")
+def up_candles() -> pd.DataFrame:
+    return make_trending_candles(250, direction="up")
+
+
+@pytest.fixture(scope="module")
+def down_candles() -> pd.DataFrame:
+    return make_trending_candles(250, direction="down")
+
+
+@pytest.fixture(scope="module")
+def flat_candles_no_close() -> pd.DataFrame:
+    """250 flat candles with the 'close' column removed."""
+    candles = make_flat_candles(250)
+    # Fresh frame, so drop in place rather than copying via .drop()
+    del candles["close"]
+    return candles
+
+
+@pytest.fixture(scope="module")
+def up_signals(strategy, up_candles) -> list[CandidateSignal]:
+    """Produce signals from the uptrend scenario."""
+    return strategy.analyze(up_candles)
+
+
+@pytest.fixture(scope="module")
+def down_signals(strategy, down_candles) -> list[CandidateSignal]:
+    """Produce signals from the downtrend scenario."""
+    return strategy.analyze(down_candles)
+
+
+@pytest.fixture(scope="module")
+def buy_signals(up_signals) -> list[CandidateSignal]:
+    """BUY signals from the uptrend scenario."""
+    return [s for s in up_signals if s.direction == Direction.BUY]
+
+
+@pytest.fixture(scope="module")
+def sell_signals(down_signals) -> list[CandidateSignal]:
+    """SELL signals from the downtrend scenario."""
+    return [s for s in down_signals if s.direction == Direction.SELL]
 
 
 # ---------------------------------------------------------------------------
@@ -165,67 +179,44 @@ class TestStrategyRegistration:
 
     def test_min_candles_200(self):
         """strategy.min_candles == 200."""
-        s = TrendContinuationStrategy()
-        assert s.min_candles == 200
+        # Declared as a ClassVar, so no instance is needed
+        assert TrendContinuationStrategy.min_candles == 200
 
     def test_strategy_name_correct(self):
         """strategy.name == 'trend_continuation'."""
-        s = TrendContinuationStrategy()
-        assert s.name == "trend_continuation"
+        assert TrendContinuationStrategy.name == "trend_continuation"
 
 
 class TestDataValidation:
     """Input validation tests."""
 
-    def test_insufficient_data_raises(self):
+    def test_insufficient_data_raises(self, strategy):
         """100 candles (< 200 min) raises InsufficientDataError."""
-        s = TrendContinuationStrategy()
         candles = make_flat_candles(100)
         with pytest.raises(InsufficientDataError):
-            s.analyze(candles)
+            strategy.analyze(candles)
 
-    def test_validate_data_missing_columns(self):
+    def test_validate_data_missing_columns(self, flat_candles_no_close, strategy):
         """DataFrame missing 'close' column raises ValueError."""
-        s = TrendContinuationStrategy()
-        candles = make_flat_candles(250)
-        bad_candles = candles.drop(columns=["close"])
         with pytest.raises(ValueError, match="Missing required columns"):
-            s.analyze(bad_candles)
+            strategy.analyze(flat_candles_no_close)
 
 
 class TestAnalyzeReturn:
     """Return type tests."""
 
-    def test_analyze_returns_list(self):
+    def test_analyze_returns_list(self, up_signals):
         """analyze() returns a list (possibly empty)."""
-        s = TrendContinuationStrategy()
-        candles = make_trending_candles(250, direction="up")
-        result = s.analyze(candles)
-        assert isinstance(result, list)
+        assert isinstance(up_signals, list)
 
-    def test_analyze_returns_list_downtrend(self):
+    def test_analyze_returns_list_downtrend(self, down_signals):
         """analyze() returns a list for downtrend data."""
-        s = TrendContinuationStrategy()
-        candles = make_trending_candles(250, direction="down")
-        result = s.analyze(candles)
-        assert isinstance(result, list)
+        assert isinstance(down_signals, list)
 
 
 class TestSignalFields:
     """Validate CandidateSignal field correctness."""
 
-    @pytest.fixture
-    def up_signals(self) -> list[CandidateSignal]:
-        s = TrendContinuationStrategy()
-        candles = make_trending_candles(250, direction="up")
-        return s.analyze(candles)
-
-    @pytest.fixture
-    def down_signals(self) -> list[CandidateSignal]:
-        s = TrendContinuationStrategy()
-        candles = make_trending_candles(250, direction="down")
-        return s.analyze(candles)
-
     def test_signal_fields_valid(self, up_signals):
         """If signals produced: direction, prices, confidence are valid."""
         for sig in up_signals:
@@ -239,9 +230,8 @@ class TestSignalFields:
             assert Decimal("0") <= sig.confidence <= Decimal("100")
             assert len(sig.reasoning) > 0
 
-    def test_buy_signal_price_ordering(self, up_signals):
+    def test_buy_signal_price_ordering(self, buy_signals):
         """BUY: SL < entry < TP1 < TP2."""
-        buy_signals = [s for s in up_signals if s.direction == Direction.BUY]
         for sig in buy_signals:
             assert sig.stop_loss < sig.entry_price, (
                 f"SL {sig.stop_loss} should be < entry {sig.entry_price}"
@@ -253,9 +243,8 @@ class TestSignalFields:
                 f"TP1 {sig.take_profit_1} should be < TP2 {sig.take_profit_2}"
             )
 
-    def test_sell_signal_price_ordering(self, down_signals):
+    def test_sell_signal_price_ordering(self, sell_signals):
         """SELL: TP2 < TP1 < entry < SL."""
-        sell_signals = [s for s in down_signals if s.direction == Direction.SELL]
         for sig in sell_signals:
             assert sig.stop_loss > sig.entry_price, (
                 f"SL {sig.stop_loss} should be > entry {sig.entry_price}"